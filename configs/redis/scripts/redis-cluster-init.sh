@@ -7,7 +7,7 @@
 # after starting the Redis containers for the first time.
 #
 # The script performs the following operations:
-# 1. Validates that REDIS_PASSWORD environment variable is set
+# 1. Validates that REDIS_PASSWORD is set (environment or first line of stdin)
 # 2. Waits for all 3 Redis nodes to become ready and responsive
 # 3. Checks if cluster is already initialized to avoid re-initialization
 # 4. Creates cluster using redis-cli --cluster create command
@@ -21,7 +21,9 @@
 #   ./redis-cluster-init.sh
 #
 #   Environment variables required:
-#     REDIS_PASSWORD - Password for authenticating to Redis nodes
+#     REDIS_PASSWORD - Password for authenticating to Redis nodes. If unset,
+#                      it is read from the first line of stdin when stdin is
+#                      not a terminal, which keeps it out of the environment.
 #
 #   Prerequisites:
 #     - 3 Redis containers must be running: dev-redis-1, dev-redis-2, dev-redis-3
@@ -52,9 +54,12 @@
 #   export REDIS_PASSWORD=mySecurePassword123
 #   ./redis-cluster-init.sh
 #
+#   # Or pass the password on stdin
+#   printf '%s\n' "$password" | ./redis-cluster-init.sh
+#
 #   # Check cluster status after initialization
-#   docker exec dev-redis-1 redis-cli -a "$REDIS_PASSWORD" cluster info
-#   docker exec dev-redis-1 redis-cli -a "$REDIS_PASSWORD" cluster nodes
+#   REDISCLI_AUTH="$REDIS_PASSWORD" docker exec -e REDISCLI_AUTH dev-redis-1 redis-cli cluster info
+#   REDISCLI_AUTH="$REDIS_PASSWORD" docker exec -e REDISCLI_AUTH dev-redis-1 redis-cli cluster nodes
 ################################################################################
 
 set -euo pipefail
@@ -131,13 +136,38 @@ error() {
     exit 1
 }
 
+#######################################
+# Run redis-cli inside a Redis container, authenticated with REDIS_PASSWORD
+# Globals:
+#   REDIS_PASSWORD - Password for Redis authentication
+# Arguments:
+#   $1 - Container name
+#   $@ - Remaining arguments passed to redis-cli
+# Returns:
+#   redis-cli exit code
+# Notes:
+#   The password travels as REDISCLI_AUTH in the docker exec environment
+#   rather than as -a, so it never shows up in ps on the host or in the
+#   container
+#######################################
+redis_cli() {
+    local container="$1"
+    shift
+    REDISCLI_AUTH="$REDIS_PASSWORD" docker exec -e REDISCLI_AUTH "$container" redis-cli "$@"
+}
+
 ################################################################################
 # MAIN SCRIPT EXECUTION
 ################################################################################
 
+# Fall back to the first line of stdin when the password is piped in
+if [ -z "${REDIS_PASSWORD:-}" ] && [ ! -t 0 ]; then
+    IFS= read -r REDIS_PASSWORD || true
+fi
+
 # Check if password is set
 if [ -z "${REDIS_PASSWORD:-}" ]; then
-    error "REDIS_PASSWORD environment variable is not set"
+    error "REDIS_PASSWORD is not set (environment or stdin)"
 fi
 
 echo
@@ -160,7 +190,7 @@ attempt=0
 # Wait for node 1 (172.20.2.13:6379)
 attempt=0
 while [ $attempt -lt $max_attempts ]; do
-    if docker exec dev-redis-1 redis-cli -h 172.20.2.13 -p 6379 -a "$REDIS_PASSWORD" ping 2>/dev/null | grep -q PONG; then
+    if redis_cli dev-redis-1 -h 172.20.2.13 -p 6379 ping 2>/dev/null | grep -q PONG; then
         success "Redis node 1 is ready"
         break
     fi
@@ -176,7 +206,7 @@ fi
 # Wait for node 2 (172.20.2.16:6379)
 attempt=0
 while [ $attempt -lt $max_attempts ]; do
-    if docker exec dev-redis-2 redis-cli -h 172.20.2.16 -p 6379 -a "$REDIS_PASSWORD" ping 2>/dev/null | grep -q PONG; then
+    if redis_cli dev-redis-2 -h 172.20.2.16 -p 6379 ping 2>/dev/null | grep -q PONG; then
         success "Redis node 2 is ready"
         break
     fi
@@ -192,7 +222,7 @@ fi
 # Wait for node 3 (172.20.2.17:6379)
 attempt=0
 while [ $attempt -lt $max_attempts ]; do
-    if docker exec dev-redis-3 redis-cli -h 172.20.2.17 -p 6379 -a "$REDIS_PASSWORD" ping 2>/dev/null | grep -q PONG; then
+    if redis_cli dev-redis-3 -h 172.20.2.17 -p 6379 ping 2>/dev/null | grep -q PONG; then
         success "Redis node 3 is ready"
         break
     fi
@@ -211,10 +241,10 @@ fi
 # already operational and script exits successfully without re-initializing.
 ################################################################################
 info "Checking if cluster is already initialized..."
-if docker exec dev-redis-1 redis-cli -a "$REDIS_PASSWORD" cluster info 2>/dev/null | grep -q "cluster_state:ok"; then
+if redis_cli dev-redis-1 cluster info 2>/dev/null | grep -q "cluster_state:ok"; then
     warning "Cluster is already initialized and running"
-    docker exec dev-redis-1 redis-cli -a "$REDIS_PASSWORD" cluster info 2>/dev/null
-    docker exec dev-redis-1 redis-cli -a "$REDIS_PASSWORD" cluster nodes 2>/dev/null
+    redis_cli dev-redis-1 cluster info 2>/dev/null
+    redis_cli dev-redis-1 cluster nodes 2>/dev/null
     echo
     success "Cluster is operational"
     exit 0
@@ -230,12 +260,11 @@ info "Creating Redis cluster..."
 info "This will assign slots to the 3 master nodes..."
 
 # Use redis-cli --cluster create
-docker exec dev-redis-1 redis-cli --cluster create \
+redis_cli dev-redis-1 --cluster create \
     172.20.2.13:6379 \
     172.20.2.16:6379 \
     172.20.2.17:6379 \
-    --cluster-yes \
-    -a "$REDIS_PASSWORD"
+    --cluster-yes
 
 if [ $? -eq 0 ]; then
     success "Redis cluster created successfully!"
@@ -250,10 +279,10 @@ fi
 ################################################################################
 echo
 info "Cluster Information:"
-docker exec dev-redis-1 redis-cli -a "$REDIS_PASSWORD" --no-auth-warning cluster info
+redis_cli dev-redis-1 cluster info
 echo
 info "Cluster Nodes:"
-docker exec dev-redis-1 redis-cli -a "$REDIS_PASSWORD" --no-auth-warning cluster nodes
+redis_cli dev-redis-1 cluster nodes
 echo
 
 success "Redis cluster is ready to use!"
@@ -21,6 +21,8 @@ class Settings(BaseSettings):
     # Vault
     VAULT_ADDR: str = os.getenv("VAULT_ADDR", "http://vault:8200")
     VAULT_TOKEN: str = os.getenv("VAULT_TOKEN", "")
+    # Seconds to cache secrets in-process (0 disables caching)
+    VAULT_CACHE_TTL: float = float(os.getenv("VAULT_CACHE_TTL", "300"))
 
     # Service endpoints (internal Docker network)
     POSTGRES_HOST: str = os.getenv("POSTGRES_HOST", "postgres")
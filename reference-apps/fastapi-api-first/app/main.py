@@ -27,6 +27,7 @@ from app.routers import (
 )
 from app.config import settings
 from app.middleware.exception_handlers import register_exception_handlers
+from app.services.vault import vault_client
 
 # Configure logging
 logging.basicConfig(
@@ -167,6 +168,7 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown event handler."""
     logger.info("Shutting down API-First FastAPI application...")
+    await vault_client.close()
 
 
 @app.get("/")
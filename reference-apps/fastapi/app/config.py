@@ -6,42 +6,73 @@ for the DevStack Core infrastructure.
 """
 
 import os
-from pydantic_settings import BaseSettings
+from dataclasses import dataclass, field
 
+from dotenv import dotenv_values
 
-class Settings(BaseSettings):
+# A local .env fills in anything not set in the environment. It is read once
+# and consulted as a fallback, never copied into os.environ.
+_DOTENV = dotenv_values(".env")
+
+# Strings read as true, as pydantic-settings parsed them
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def _getenv(name: str, default: str) -> str:
+    value = os.getenv(name)
+    if value is None:
+        value = _DOTENV.get(name)
+    return default if value is None else value
+
+
+def _env_str(name: str, default: str):
+    return field(default_factory=lambda: _getenv(name, default))
+
+
+def _env_int(name: str, default: str):
+    return field(default_factory=lambda: int(_getenv(name, default)))
+
+
+def _env_float(name: str, default: str):
+    return field(default_factory=lambda: float(_getenv(name, default)))
+
+
+def _env_bool(name: str, default: str):
+    return field(default_factory=lambda: _getenv(name, default).strip().lower() in _TRUE_VALUES)
+
+
+@dataclass(slots=True)
+class Settings:
     """Application settings"""
 
     # Application
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+    DEBUG: bool = _env_bool("DEBUG", "false")
     APP_NAME: str = "DevStack Core Reference API"
 
     # Vault
-    VAULT_ADDR: str = os.getenv("VAULT_ADDR", "http://vault:8200")
-    VAULT_TOKEN: str = os.getenv("VAULT_TOKEN", "")
+    VAULT_ADDR: str = _env_str("VAULT_ADDR", "http://vault:8200")
+    VAULT_TOKEN: str = _env_str("VAULT_TOKEN", "")
+    # Seconds to cache secrets in-process (0 disables caching)
+    VAULT_CACHE_TTL: float = _env_float("VAULT_CACHE_TTL", "300")
 
     # Service endpoints (internal Docker network)
-    POSTGRES_HOST: str = os.getenv("POSTGRES_HOST", "postgres")
-    POSTGRES_PORT: int = int(os.getenv("POSTGRES_PORT", "5432"))
+    POSTGRES_HOST: str = _env_str("POSTGRES_HOST", "postgres")
+    POSTGRES_PORT: int = _env_int("POSTGRES_PORT", "5432")
 
-    MYSQL_HOST: str = os.getenv("MYSQL_HOST", "mysql")
-    MYSQL_PORT: int = int(os.getenv("MYSQL_PORT", "3306"))
+    MYSQL_HOST: str = _env_str("MYSQL_HOST", "mysql")
+    MYSQL_PORT: int = _env_int("MYSQL_PORT", "3306")
 
-    MONGODB_HOST: str = os.getenv("MONGODB_HOST", "mongodb")
-    MONGODB_PORT: int = int(os.getenv("MONGODB_PORT", "27017"))
+    MONGODB_HOST: str = _env_str("MONGODB_HOST", "mongodb")
+    MONGODB_PORT: int = _env_int("MONGODB_PORT", "27017")
 
-    REDIS_HOST: str = os.getenv("REDIS_HOST", "redis-1")
-    REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
+    REDIS_HOST: str = _env_str("REDIS_HOST", "redis-1")
+    REDIS_PORT: int = _env_int("REDIS_PORT", "6379")
 
-    RABBITMQ_HOST: str = os.getenv("RABBITMQ_HOST", "rabbitmq")
-    RABBITMQ_PORT: int = int(os.getenv("RABBITMQ_PORT", "5672"))
+    RABBITMQ_HOST: str = _env_str("RABBITMQ_HOST", "rabbitmq")
+    RABBITMQ_PORT: int = _env_int("RABBITMQ_PORT", "5672")
 
     # Redis Cluster nodes
-    REDIS_NODES: str = os.getenv("REDIS_NODES", "redis-1:6379,redis-2:6379,redis-3:6379")
-
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    REDIS_NODES: str = _env_str("REDIS_NODES", "redis-1:6379,redis-2:6379,redis-3:6379")
 
 
 settings = Settings()
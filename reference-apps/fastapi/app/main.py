@@ -386,4 +386,6 @@ async def shutdown_event():
     """Cleanup on shutdown"""
     # Close cache connection
     await cache_manager.close()
+    # Release pooled Vault connections
+    await vault_client.close()
     logger.info("Shutting down DevStack Core Reference API")
@@ -5,17 +5,51 @@ Demonstrates how to integrate with HashiCorp Vault to fetch credentials
 for other infrastructure services.
 """
 
+import asyncio
 import httpx
+import ipaddress
 import logging
 import re
-from typing import Optional, Dict, Any
-from urllib.parse import urljoin
+import socket
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable, Tuple, Union
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to httpx's stdlib decoding
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx (httpx[http2])
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 from app.config import settings
 from app.exceptions import VaultUnavailableError, ResourceNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Allowed characters for secret paths. "." is excluded, so traversal sequences
+# like ".." are rejected by the same single pass.
+_SECRET_PATH_RE = re.compile(r'[a-zA-Z0-9/_-]+', re.ASCII)
+
+# Secret paths the application itself reads. They are already in canonical
+# form, so get_secret skips validation for them.
+_SAFE_SECRET_PATHS = frozenset({"postgres", "mysql", "mongodb", "redis-1", "rabbitmq"})
+
+# How long a health check result is reused, so bursts of /health polls
+# collapse into a single request to Vault
+_HEALTH_CACHE_SECONDS = 2.0
+
+# Marks a key absent from a secret (its value may legitimately be None)
+_MISSING = object()
+
+# Upper bound on cached (path, key) entries before the least recently used is evicted
+_SECRET_CACHE_MAX_ENTRIES = 256
+
 
 class VaultClient:
     """Client for interacting with HashiCorp Vault"""
@@ -24,6 +58,128 @@ class VaultClient:
         self.vault_addr = settings.VAULT_ADDR
         self.vault_token = settings.VAULT_TOKEN
         self.headers = {"X-Vault-Token": self.vault_token}
+        # Created lazily so the connection pool binds to the running event loop
+        self._client: Optional[httpx.AsyncClient] = None
+        # Whether the pooled client connects to a resolved IP, not the hostname
+        self._pinned = False
+        # (path, key) -> (fetched_at, secret); secrets rarely change, so reads
+        # within VAULT_CACHE_TTL seconds are served from memory
+        self._cache: "OrderedDict[Tuple[str, Optional[str]], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_ttl = settings.VAULT_CACHE_TTL
+        # (path, key) -> task running the Vault read currently in progress
+        self._inflight: Dict[Tuple[str, Optional[str]], "asyncio.Task[Dict[str, Any]]"] = {}
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+    async def _resolve_base_url(self) -> Tuple[str, Dict[str, str]]:
+        """
+        Resolve the Vault hostname once for the lifetime of the pooled client.
+
+        Returns the base URL to connect to and any extra headers. Only plain
+        HTTP addresses are pinned to an IP (TLS needs the hostname for SNI and
+        certificate checks); the original Host header is kept so Vault sees
+        the same request. If the lookup fails, the hostname is used as-is and
+        the error surfaces on the first request. A pinned client that can no
+        longer connect is replaced and the name resolved again (see _send).
+        """
+        parts = urlsplit(self.vault_addr)
+        host = parts.hostname
+        if parts.scheme != "http" or not host:
+            return self.vault_addr, {}
+
+        try:
+            ipaddress.ip_address(host)
+            return self.vault_addr, {}
+        except ValueError:
+            pass
+
+        try:
+            addrinfo = await asyncio.get_running_loop().getaddrinfo(
+                host, parts.port or 80, proto=socket.IPPROTO_TCP
+            )
+        except OSError:
+            return self.vault_addr, {}
+
+        ip = addrinfo[0][4][0]
+        if ":" in ip:
+            ip = f"[{ip}]"
+        netloc = f"{ip}:{parts.port}" if parts.port else ip
+        return parts._replace(netloc=netloc).geturl(), {"Host": parts.netloc}
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self._client is None:
+            base_url, extra_headers = await self._resolve_base_url()
+            # Another task may have created the client during the lookup
+            if self._client is not None:
+                return self._client
+            self._pinned = bool(extra_headers)
+            self._client = httpx.AsyncClient(
+                base_url=base_url,
+                headers={**self.headers, **extra_headers},
+                # HTTP/2 is negotiated over TLS only; multiplexing lets
+                # get_secrets fan out over a single connection
+                http2=_HTTP2_AVAILABLE and base_url.startswith("https://"),
+                timeout=5.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=30.0,
+                ),
+            )
+        return self._client
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request through the pooled client.
+
+        The pinned IP goes stale when the Vault container is recreated and
+        gets a new address, so a connection failure on a pinned client
+        discards it and retries once with a freshly resolved one.
+        """
+        client = await self._get_client()
+        try:
+            return await getattr(client, method)(url, **kwargs)
+        except httpx.ConnectError:
+            if self._client is client:
+                if not self._pinned:
+                    raise
+                self._client = None
+                await client.aclose()
+            client = await self._get_client()
+            return await getattr(client, method)(url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client and release its connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def clear_cache(self) -> None:
+        """Drop all cached secrets so the next read goes to Vault"""
+        self._cache.clear()
+
+    def _cache_get(self, cache_key: Tuple[str, Optional[str]]) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+        fetched_at, secret = entry
+        if time.monotonic() - fetched_at >= self._cache_ttl:
+            del self._cache[cache_key]
+            return None
+        self._cache.move_to_end(cache_key)
+        return dict(secret)
+
+    def _cache_put(self, cache_key: Tuple[str, Optional[str]], secret: Dict[str, Any]) -> None:
+        self._cache[cache_key] = (time.monotonic(), dict(secret))
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > _SECRET_CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    async def __aenter__(self) -> "VaultClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
 
     def _validate_secret_path(self, path: str) -> str:
         """
@@ -42,13 +198,10 @@ class VaultClient:
         path = path.strip("/")
 
         # Only allow alphanumeric, hyphens, underscores, and forward slashes
-        if not re.match(r'^[a-zA-Z0-9/_-]+$', path):
+        # (which also rules out path traversal)
+        if not _SECRET_PATH_RE.fullmatch(path):
             raise ValueError(f"Invalid secret path: {path}. Only alphanumeric characters, hyphens, underscores, and forward slashes are allowed.")
 
-        # Prevent path traversal
-        if ".." in path:
-            raise ValueError(f"Invalid secret path: {path}. Path traversal sequences are not allowed.")
-
         return path
 
     async def get_secret(self, path: str, key: Optional[str] = None) -> Dict[str, Any]:
@@ -67,107 +220,194 @@ class VaultClient:
             ResourceNotFoundError: If the secret doesn't exist
             ValueError: If path contains invalid characters
         """
-        # Validate path to prevent SSRF
-        validated_path = self._validate_secret_path(path)
+        # Validate path to prevent SSRF (known internal paths need no check)
+        validated_path = path if path in _SAFE_SECRET_PATHS else self._validate_secret_path(path)
+
+        if self._cache_ttl <= 0:
+            return await self._fetch_secret(validated_path, path, key)
+
+        cache_key = (validated_path, key)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Single-flight: concurrent misses for the same secret await the read
+        # already in progress instead of issuing their own. The read runs as
+        # its own task and every caller, including the one that started it,
+        # awaits it through shield(), so a cancelled caller never cancels the
+        # read out from under the others.
+        inflight = self._inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._fetch_and_cache(cache_key, validated_path, path, key)
+            )
+            # Mark the outcome retrieved so an error nobody awaits isn't logged
+            inflight.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._inflight[cache_key] = inflight
+        return dict(await asyncio.shield(inflight))
+
+    async def _fetch_and_cache(
+        self,
+        cache_key: Tuple[str, Optional[str]],
+        validated_path: str,
+        path: str,
+        key: Optional[str],
+    ) -> Dict[str, Any]:
+        """Run the shared read for get_secret and cache its result"""
+        try:
+            secret = await self._fetch_secret(validated_path, path, key)
+            self._cache_put(cache_key, secret)
+            return secret
+        finally:
+            del self._inflight[cache_key]
+
+    async def _fetch_secret(self, validated_path: str, path: str, key: Optional[str]) -> Dict[str, Any]:
+        """Read a secret from Vault over HTTP, bypassing the cache"""
+        try:
+            # Relative to the client's base_url; the path is already whitelisted
+            # so no quoting or URL parsing is needed
+            response = await self._send("get", f"/v1/secret/data/{validated_path}")
+
+            # Handle 404 specifically
+            if response.status_code == 404:
+                raise ResourceNotFoundError(
+                    resource_type="secret",
+                    resource_id=path,
+                    message=f"Secret '{path}' not found in Vault",
+                    details={"secret_path": path, "key": key}
+                )
+
+            # Handle 403 (permission denied)
+            if response.status_code == 403:
+                raise VaultUnavailableError(
+                    message="Permission denied accessing Vault secret",
+                    secret_path=path,
+                    details={"status_code": 403}
+                )
 
-        # Construct URL safely
-        url = urljoin(f"{self.vault_addr}/", f"v1/secret/data/{validated_path}")
+            # 403/404 are classified above; anything else >= 400 is a Vault-side error
+            if response.status_code >= 400:
+                raise VaultUnavailableError(
+                    message=f"Vault returned an error: HTTP {response.status_code}",
+                    secret_path=path,
+                    details={"status_code": response.status_code, "body": response.text[:500]}
+                )
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self.headers, timeout=5.0)
+            data = orjson.loads(response.content) if orjson else response.json()
+            secret_data = data.get("data", {}).get("data", {})
 
-                # Handle 404 specifically
-                if response.status_code == 404:
+            if key:
+                # Single lookup; the sentinel tells a missing key from a None value
+                value = secret_data.get(key, _MISSING)
+                if value is _MISSING:
                     raise ResourceNotFoundError(
-                        resource_type="secret",
-                        resource_id=path,
-                        message=f"Secret '{path}' not found in Vault",
+                        resource_type="secret_key",
+                        resource_id=f"{path}/{key}",
+                        message=f"Key '{key}' not found in secret '{path}'",
                         details={"secret_path": path, "key": key}
                     )
+                return {key: value}
 
-                # Handle 403 (permission denied)
-                if response.status_code == 403:
-                    raise VaultUnavailableError(
-                        message="Permission denied accessing Vault secret",
-                        secret_path=path,
-                        details={"status_code": 403}
-                    )
-
-                response.raise_for_status()
-
-                data = response.json()
-                secret_data = data.get("data", {}).get("data", {})
-
-                if key:
-                    # Check if the specific key exists
-                    if key not in secret_data:
-                        raise ResourceNotFoundError(
-                            resource_type="secret_key",
-                            resource_id=f"{path}/{key}",
-                            message=f"Key '{key}' not found in secret '{path}'",
-                            details={"secret_path": path, "key": key}
-                        )
-                    return {key: secret_data.get(key)}
-
-                return secret_data
+            return secret_data
 
         except (ResourceNotFoundError, VaultUnavailableError):
             # Re-raise our custom exceptions
             raise
         except httpx.TimeoutException as e:
-            logger.error(f"Timeout fetching secret from Vault: {e}")
+            logger.error("Timeout fetching secret from Vault: %s", e)
             raise VaultUnavailableError(
                 message="Timeout connecting to Vault",
                 secret_path=path,
                 details={"error": str(e), "timeout": "5.0s"}
             )
         except httpx.ConnectError as e:
-            logger.error(f"Connection error to Vault: {e}")
+            logger.error("Connection error to Vault: %s", e)
             raise VaultUnavailableError(
                 message="Cannot connect to Vault server",
                 secret_path=path,
                 details={"error": str(e), "vault_address": self.vault_addr}
             )
         except httpx.HTTPError as e:
-            logger.error(f"HTTP error fetching secret from Vault: {e}")
+            logger.error("HTTP error fetching secret from Vault: %s", e)
             raise VaultUnavailableError(
                 message=f"Vault returned an error: {e}",
                 secret_path=path,
                 details={"error": str(e)}
             )
-        except Exception as e:
-            logger.error(f"Unexpected error fetching secret: {e}")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            # Malformed response body (invalid JSON or unexpected shape).
+            # Anything else, including cancellation, propagates unchanged.
+            logger.error("Unexpected error fetching secret: %s", e)
             raise VaultUnavailableError(
                 message=f"Unexpected error accessing Vault: {e}",
                 secret_path=path,
                 details={"error": str(e)}
             )
 
+    async def get_secrets(
+        self,
+        specs: Iterable[Tuple[str, Optional[str]]],
+        return_exceptions: bool = False,
+    ) -> Dict[Tuple[str, Optional[str]], Union[Dict[str, Any], Exception]]:
+        """
+        Fetch several secrets concurrently
+
+        All reads share the pooled HTTP client, so loading N secrets at
+        startup costs roughly one round trip instead of N:
+
+            creds = await vault_client.get_secrets([("postgres", None), ("redis-1", "password")])
+
+        Args:
+            specs: (path, key) pairs, as passed to get_secret
+            return_exceptions: Store per-secret errors in the result instead
+                of raising the first one
+
+        Returns:
+            Mapping of each (path, key) pair to its secret data (or error)
+
+        Raises:
+            VaultUnavailableError, ResourceNotFoundError, ValueError: As for
+                get_secret, unless return_exceptions is set
+        """
+        specs = list(specs)
+        results = await asyncio.gather(
+            *(self.get_secret(path, key) for path, key in specs),
+            return_exceptions=return_exceptions,
+        )
+        return dict(zip(specs, results))
+
     async def check_health(self) -> Dict[str, Any]:
         """Check Vault health status"""
-        url = f"{self.vault_addr}/v1/sys/health"
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < _HEALTH_CACHE_SECONDS:
+            return dict(self._health_cache[1])
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{url}?standbyok=true",
-                    timeout=5.0
-                )
+            # sys/health reports everything through the status code, so HEAD
+            # skips downloading a body we would ignore
+            response = await self._send(
+                "head",
+                "/v1/sys/health",
+                params={"standbyok": "true"},
+                timeout=2.0
+            )
 
-                return {
-                    "status": "healthy" if response.status_code == 200 else "unhealthy",
-                    "initialized": response.status_code != 501,
-                    "sealed": response.status_code == 503,
-                    "standby": response.status_code == 429,
-                }
+            result = {
+                "status": "healthy" if response.status_code == 200 else "unhealthy",
+                "initialized": response.status_code != 501,
+                "sealed": response.status_code == 503,
+                "standby": response.status_code == 429,
+            }
         except Exception as e:
             logger.error(f"Vault health check failed: {e}")
-            return {
+            result = {
                 "status": "unhealthy",
                 "error": "Health check failed"
             }
 
+        self._health_cache = (now, result)
+        return dict(result)
+
 
 # Global Vault client instance
 vault_client = VaultClient()
@@ -149,6 +149,8 @@ check_tls_certs() {
 # Notes:
 #   - Binds to 0.0.0.0 for all network interfaces
 #   - Uses --reload for development (auto-restart on code changes)
+#   - Pins the uvloop event loop and httptools parser (both installed by
+#     uvicorn[standard]) instead of relying on auto-detection
 #   - Runs in background (&) to allow HTTPS server startup
 #   - PID stored in HTTP_PID for shutdown coordination
 #######################################
@@ -157,6 +159,8 @@ start_http() {
     uvicorn app.main:app \
         --host 0.0.0.0 \
         --port "$HTTP_PORT" \
+        --loop uvloop \
+        --http httptools \
         --reload &
     HTTP_PID=$!
     success "HTTP server started (PID: $HTTP_PID)"
@@ -181,6 +185,8 @@ start_http() {
 # Notes:
 #   - Binds to 0.0.0.0 for all network interfaces
 #   - Uses --reload for development (auto-restart on code changes)
+#   - Pins the uvloop event loop and httptools parser (both installed by
+#     uvicorn[standard]) instead of relying on auto-detection
 #   - Runs in background (&) for parallel operation with HTTP server
 #   - PID stored in HTTPS_PID for shutdown coordination
 #   - Certificate files must exist and be readable by process
@@ -192,6 +198,8 @@ start_https() {
         --port "$HTTPS_PORT" \
         --ssl-keyfile "$KEY_FILE" \
         --ssl-certfile "$CERT_FILE" \
+        --loop uvloop \
+        --http httptools \
         --reload &
     HTTPS_PID=$!
     success "HTTPS server started (PID: $HTTPS_PID)"
@@ -124,6 +124,7 @@ def mock_httpx_client():
     mock_response = AsyncMock()
     mock_response.status_code = 200
     mock_response.json = MagicMock(return_value={"data": {"data": {"key": "value"}}})
+    mock_response.content = b'{"data": {"data": {"key": "value"}}}'
     mock_response.raise_for_status = MagicMock()
     mock_client.get = AsyncMock(return_value=mock_response)
     mock_client.__aenter__ = AsyncMock(return_value=mock_client)
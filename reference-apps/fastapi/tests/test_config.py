@@ -0,0 +1,73 @@
+"""
+Unit tests for application settings
+
+Tests environment lookup, .env fallback, type coercion and defaults.
+"""
+
+import pytest
+
+from app import config
+from app.config import Settings
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Clear the settings read below from the environment and the .env fallback"""
+    for name in ("DEBUG", "VAULT_ADDR", "VAULT_CACHE_TTL", "POSTGRES_PORT"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(config, "_DOTENV", {})
+    return monkeypatch
+
+
+@pytest.mark.unit
+class TestSettings:
+    """Test Settings construction"""
+
+    def test_defaults(self, clean_env):
+        """Test that unset variables fall back to their defaults"""
+        settings = Settings()
+
+        assert settings.DEBUG is False
+        assert settings.VAULT_ADDR == "http://vault:8200"
+        assert settings.VAULT_CACHE_TTL == 300.0
+        assert settings.POSTGRES_PORT == 5432
+
+    def test_dotenv_used_when_environment_unset(self, clean_env):
+        """Test that .env values fill in variables missing from the environment"""
+        clean_env.setattr(config, "_DOTENV", {"VAULT_ADDR": "http://dotenv:8200", "POSTGRES_PORT": None})
+
+        settings = Settings()
+
+        assert settings.VAULT_ADDR == "http://dotenv:8200"
+        assert settings.POSTGRES_PORT == 5432
+
+    def test_environment_overrides_dotenv(self, clean_env):
+        """Test that the environment takes precedence over .env"""
+        clean_env.setattr(config, "_DOTENV", {"VAULT_ADDR": "http://dotenv:8200"})
+        clean_env.setenv("VAULT_ADDR", "http://env:8200")
+
+        assert Settings().VAULT_ADDR == "http://env:8200"
+
+    def test_numeric_coercion(self, clean_env):
+        """Test that int and float settings are parsed from strings"""
+        clean_env.setenv("POSTGRES_PORT", "6543")
+        clean_env.setenv("VAULT_CACHE_TTL", "1.5")
+
+        settings = Settings()
+
+        assert settings.POSTGRES_PORT == 6543
+        assert settings.VAULT_CACHE_TTL == 1.5
+
+    @pytest.mark.parametrize("value", ["1", "true", "True", "YES", "on"])
+    def test_truthy_bool_values(self, clean_env, value):
+        """Test that the truthy spellings pydantic-settings accepted enable a flag"""
+        clean_env.setenv("DEBUG", value)
+
+        assert Settings().DEBUG is True
+
+    @pytest.mark.parametrize("value", ["0", "false", "no", "off", ""])
+    def test_falsy_bool_values(self, clean_env, value):
+        """Test that other values leave a flag disabled"""
+        clean_env.setenv("DEBUG", value)
+
+        assert Settings().DEBUG is False
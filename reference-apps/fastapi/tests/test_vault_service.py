@@ -4,6 +4,10 @@ Unit tests for Vault service with exception handling
 Tests the VaultClient class and its error handling behavior.
 """
 
+import asyncio
+import json
+import socket
+
 import pytest
 import httpx
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -12,6 +16,13 @@ from app.services.vault import VaultClient
 from app.exceptions import VaultUnavailableError, ResourceNotFoundError
 
 
+@pytest.fixture(autouse=True)
+def no_vault_dns():
+    """Keep these tests off the network when the client resolves the Vault host"""
+    with patch('socket.getaddrinfo', side_effect=socket.gaierror):
+        yield
+
+
 @pytest.mark.unit
 class TestVaultClientGetSecret:
     """Test VaultClient.get_secret method"""
@@ -24,14 +35,14 @@ class TestVaultClientGetSecret:
     @pytest.mark.asyncio
     async def test_get_secret_success(self, vault_client, mock_httpx_client):
         """Test successful secret retrieval"""
-        mock_httpx_client.get.return_value.json.return_value = {
+        mock_httpx_client.get.return_value.content = json.dumps({
             "data": {
                 "data": {
                     "user": "test_user",
                     "password": "test_pass"
                 }
             }
-        }
+        }).encode()
 
         with patch('httpx.AsyncClient', return_value=mock_httpx_client):
             result = await vault_client.get_secret("postgres")
@@ -42,7 +53,7 @@ class TestVaultClientGetSecret:
     @pytest.mark.asyncio
     async def test_get_secret_with_key(self, vault_client, mock_httpx_client):
         """Test retrieving specific key from secret"""
-        mock_httpx_client.get.return_value.json.return_value = {
+        mock_httpx_client.get.return_value.content = json.dumps({
             "data": {
                 "data": {
                     "user": "test_user",
@@ -50,7 +61,7 @@ class TestVaultClientGetSecret:
                     "database": "test_db"
                 }
             }
-        }
+        }).encode()
 
         with patch('httpx.AsyncClient', return_value=mock_httpx_client):
             result = await vault_client.get_secret("postgres", key="user")
@@ -59,6 +70,16 @@ class TestVaultClientGetSecret:
             assert "password" not in result
             assert "database" not in result
 
+    @pytest.mark.asyncio
+    async def test_get_secret_without_orjson_uses_response_json(self, vault_client, mock_httpx_client):
+        """Test that parsing falls back to response.json() when orjson is missing"""
+        with patch('app.services.vault.orjson', None), \
+                patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            result = await vault_client.get_secret("postgres")
+
+        assert result == {"key": "value"}
+        mock_httpx_client.get.return_value.json.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_secret_404_raises_not_found(self, vault_client, vault_404_response):
         """Test that 404 response raises ResourceNotFoundError"""
@@ -93,14 +114,14 @@ class TestVaultClientGetSecret:
     @pytest.mark.asyncio
     async def test_get_secret_key_not_found_raises_error(self, vault_client, mock_httpx_client):
         """Test that requesting non-existent key raises ResourceNotFoundError"""
-        mock_httpx_client.get.return_value.json.return_value = {
+        mock_httpx_client.get.return_value.content = json.dumps({
             "data": {
                 "data": {
                     "user": "test_user",
                     "password": "test_pass"
                 }
             }
-        }
+        }).encode()
 
         with patch('httpx.AsyncClient', return_value=mock_httpx_client):
             with pytest.raises(ResourceNotFoundError) as exc_info:
@@ -109,6 +130,16 @@ class TestVaultClientGetSecret:
             assert exc_info.value.resource_type == "secret_key"
             assert "nonexistent_key" in exc_info.value.resource_id
 
+    @pytest.mark.asyncio
+    async def test_get_secret_with_key_holding_null(self, vault_client, mock_httpx_client):
+        """Test that a key present with a null value is returned, not treated as missing"""
+        mock_httpx_client.get.return_value.content = b'{"data": {"data": {"note": null}}}'
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            result = await vault_client.get_secret("postgres", key="note")
+
+        assert result == {"note": None}
+
     @pytest.mark.asyncio
     async def test_get_secret_timeout_raises_vault_unavailable(self, vault_client):
         """Test that timeout raises VaultUnavailableError"""
@@ -145,11 +176,7 @@ class TestVaultClientGetSecret:
         mock_client = AsyncMock()
         mock_response = MagicMock()
         mock_response.status_code = 500
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Server error",
-            request=MagicMock(),
-            response=mock_response
-        )
+        mock_response.text = "internal error " * 100
         mock_client.get.return_value = mock_response
         mock_client.__aenter__.return_value = mock_client
         mock_client.__aexit__.return_value = None
@@ -159,12 +186,18 @@ class TestVaultClientGetSecret:
                 await vault_client.get_secret("test")
 
             assert "vault returned an error" in str(exc_info.value).lower()
+            assert exc_info.value.details["status_code"] == 500
+            assert len(exc_info.value.details["body"]) == 500
 
     @pytest.mark.asyncio
     async def test_get_secret_unexpected_error_raises_vault_unavailable(self, vault_client):
-        """Test that unexpected errors raise VaultUnavailableError"""
+        """Test that a malformed response raises VaultUnavailableError"""
         mock_client = AsyncMock()
-        mock_client.get.side_effect = Exception("Unexpected error")
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b"not json"
+        mock_response.json.side_effect = ValueError("not json")
+        mock_client.get.return_value = mock_response
         mock_client.__aenter__.return_value = mock_client
         mock_client.__aexit__.return_value = None
 
@@ -174,6 +207,18 @@ class TestVaultClientGetSecret:
 
             assert "unexpected error" in str(exc_info.value).lower()
 
+    @pytest.mark.asyncio
+    async def test_get_secret_cancellation_propagates(self, vault_client):
+        """Test that cancellation is not wrapped in VaultUnavailableError"""
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = asyncio.CancelledError()
+
+        with patch('httpx.AsyncClient', return_value=mock_client):
+            with pytest.raises(asyncio.CancelledError):
+                await vault_client.get_secret("test")
+
+        assert vault_client._inflight == {}
+
 
 @pytest.mark.unit
 class TestVaultClientCheckHealth:
@@ -190,7 +235,7 @@ class TestVaultClientCheckHealth:
         mock_client = AsyncMock()
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_client.get.return_value = mock_response
+        mock_client.head.return_value = mock_response
         mock_client.__aenter__.return_value = mock_client
         mock_client.__aexit__.return_value = None
 
@@ -207,7 +252,7 @@ class TestVaultClientCheckHealth:
         mock_client = AsyncMock()
         mock_response = MagicMock()
         mock_response.status_code = 503
-        mock_client.get.return_value = mock_response
+        mock_client.head.return_value = mock_response
         mock_client.__aenter__.return_value = mock_client
         mock_client.__aexit__.return_value = None
 
@@ -223,7 +268,7 @@ class TestVaultClientCheckHealth:
         mock_client = AsyncMock()
         mock_response = MagicMock()
         mock_response.status_code = 501
-        mock_client.get.return_value = mock_response
+        mock_client.head.return_value = mock_response
         mock_client.__aenter__.return_value = mock_client
         mock_client.__aexit__.return_value = None
 
@@ -238,7 +283,7 @@ class TestVaultClientCheckHealth:
         mock_client = AsyncMock()
         mock_response = MagicMock()
         mock_response.status_code = 429
-        mock_client.get.return_value = mock_response
+        mock_client.head.return_value = mock_response
         mock_client.__aenter__.return_value = mock_client
         mock_client.__aexit__.return_value = None
 
@@ -251,7 +296,7 @@ class TestVaultClientCheckHealth:
     async def test_check_health_connection_error(self, vault_client):
         """Test health check when connection fails"""
         mock_client = AsyncMock()
-        mock_client.get.side_effect = Exception("Connection failed")
+        mock_client.head.side_effect = Exception("Connection failed")
         mock_client.__aenter__.return_value = mock_client
         mock_client.__aexit__.return_value = None
 
@@ -262,6 +307,137 @@ class TestVaultClientCheckHealth:
             assert "error" in result
 
 
+@pytest.mark.unit
+class TestVaultClientGetSecrets:
+    """Test VaultClient.get_secrets batch loading"""
+
+    @pytest.mark.asyncio
+    async def test_get_secrets_returns_mapping(self, mock_httpx_client):
+        """Test that each (path, key) pair maps to its secret"""
+        client = VaultClient()
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            result = await client.get_secrets([("postgres", None), ("mysql", "key")])
+
+        assert result == {
+            ("postgres", None): {"key": "value"},
+            ("mysql", "key"): {"key": "value"},
+        }
+        assert mock_httpx_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_secrets_raises_first_error(self, vault_404_response):
+        """Test that errors propagate by default"""
+        client = VaultClient()
+        mock_client = AsyncMock()
+        mock_client.get.return_value = vault_404_response
+
+        with patch('httpx.AsyncClient', return_value=mock_client):
+            with pytest.raises(ResourceNotFoundError):
+                await client.get_secrets([("missing", None)])
+
+    @pytest.mark.asyncio
+    async def test_get_secrets_return_exceptions(self, mock_httpx_client):
+        """Test that return_exceptions keeps per-secret errors in the result"""
+        client = VaultClient()
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            result = await client.get_secrets(
+                [("postgres", None), ("../bad", None)], return_exceptions=True
+            )
+
+        assert result[("postgres", None)] == {"key": "value"}
+        assert isinstance(result[("../bad", None)], ValueError)
+
+
+@pytest.mark.unit
+class TestVaultClientPathValidation:
+    """Test VaultClient._validate_secret_path"""
+
+    @pytest.mark.parametrize("path,expected", [
+        ("postgres", "postgres"),
+        ("/redis-1/", "redis-1"),
+        ("apps/my_service", "apps/my_service"),
+    ])
+    def test_valid_paths(self, path, expected):
+        """Test that well-formed paths are accepted and trimmed"""
+        assert VaultClient()._validate_secret_path(path) == expected
+
+    @pytest.mark.asyncio
+    async def test_known_paths_skip_validation(self, mock_httpx_client):
+        """Test that built-in secret paths bypass the regex check"""
+        client = VaultClient()
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client), \
+                patch.object(client, '_validate_secret_path') as validate:
+            await client.get_secret("postgres")
+            await client.get_secret("custom/app")
+
+        validate.assert_called_once_with("custom/app")
+
+    @pytest.mark.parametrize("path", [
+        "../etc/passwd",
+        "postgres/..",
+        "postgres\n",
+        "post gres",
+        "pöstgres",
+        "",
+    ])
+    def test_invalid_paths_rejected(self, path):
+        """Test that traversal, whitespace and non-ASCII paths are rejected"""
+        with pytest.raises(ValueError, match="Invalid secret path"):
+            VaultClient()._validate_secret_path(path)
+
+
+@pytest.mark.unit
+class TestVaultClientHealthCache:
+    """Test VaultClient.check_health result caching"""
+
+    @pytest.mark.asyncio
+    async def test_health_result_reused_within_window(self):
+        """Test that back-to-back health checks hit Vault once"""
+        client = VaultClient()
+        mock_client = AsyncMock()
+        mock_client.head.return_value = MagicMock(status_code=200)
+
+        with patch('httpx.AsyncClient', return_value=mock_client):
+            first = await client.check_health()
+            second = await client.check_health()
+
+        assert first == second
+        mock_client.head.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_health_rechecked_after_window(self):
+        """Test that a stale health result is refreshed"""
+        client = VaultClient()
+        mock_client = AsyncMock()
+        mock_client.head.return_value = MagicMock(status_code=200)
+
+        with patch('httpx.AsyncClient', return_value=mock_client), \
+                patch('app.services.vault.time.monotonic', return_value=100.0) as clock:
+            await client.check_health()
+            clock.return_value = 103.0
+            await client.check_health()
+
+        assert mock_client.head.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_health_uses_head_request(self):
+        """Test that the health check sends HEAD with standbyok"""
+        client = VaultClient()
+        mock_client = AsyncMock()
+        mock_client.head.return_value = MagicMock(status_code=200)
+
+        with patch('httpx.AsyncClient', return_value=mock_client):
+            await client.check_health()
+
+        args, kwargs = mock_client.head.call_args
+        assert args == ("/v1/sys/health",)
+        assert kwargs["params"] == {"standbyok": "true"}
+        mock_client.get.assert_not_called()
+
+
 @pytest.mark.unit
 class TestVaultClientInitialization:
     """Test VaultClient initialization"""
@@ -279,6 +455,289 @@ class TestVaultClientInitialization:
             assert client.headers["X-Vault-Token"] == "test-token"
 
 
+@pytest.mark.unit
+class TestVaultClientConnectionPool:
+    """Test VaultClient HTTP client reuse and cleanup"""
+
+    @pytest.mark.asyncio
+    async def test_http_client_reused_across_calls(self, mock_httpx_client):
+        """Test that one pooled client serves every request"""
+        client = VaultClient()
+        mock_httpx_client.get.return_value.content = json.dumps({
+            "data": {"data": {"password": "secret"}}
+        }).encode()
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client) as factory:
+            await client.get_secret("postgres")
+            await client.get_secret("mysql")
+            await client.check_health()
+
+        factory.assert_called_once()
+        assert mock_httpx_client.get.call_count == 2
+        assert mock_httpx_client.get.call_args_list[0].args == ("/v1/secret/data/postgres",)
+        mock_httpx_client.head.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("addr,h2_installed,expected", [
+        ("https://vault:8200", True, True),
+        ("https://vault:8200", False, False),
+        ("http://127.0.0.1:8200", True, False),
+    ])
+    async def test_http2_only_over_tls(self, mock_httpx_client, addr, h2_installed, expected):
+        """Test that HTTP/2 is enabled only for TLS addresses with h2 installed"""
+        client = VaultClient()
+        client.vault_addr = addr
+
+        with patch('app.services.vault._HTTP2_AVAILABLE', h2_installed), \
+                patch('httpx.AsyncClient', return_value=mock_httpx_client) as factory:
+            await client.check_health()
+
+        assert factory.call_args.kwargs["http2"] is expected
+
+    @pytest.mark.asyncio
+    async def test_close_releases_http_client(self, mock_httpx_client):
+        """Test that close() shuts down the pooled client"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            async with VaultClient() as client:
+                await client.check_health()
+
+        mock_httpx_client.aclose.assert_awaited_once()
+        assert client._client is None
+
+    @pytest.mark.asyncio
+    async def test_close_without_requests_is_noop(self):
+        """Test that closing an unused client does not create one"""
+        client = VaultClient()
+
+        with patch('httpx.AsyncClient') as factory:
+            await client.close()
+
+        factory.assert_not_called()
+
+
+@pytest.mark.unit
+class TestVaultClientAddressResolution:
+    """Test VaultClient._resolve_base_url host pinning"""
+
+    def _client_for(self, addr):
+        client = VaultClient()
+        client.vault_addr = addr
+        return client
+
+    @pytest.mark.asyncio
+    async def test_http_hostname_pinned_to_ip(self):
+        """Test that an http:// hostname is resolved once and Host is preserved"""
+        client = self._client_for("http://vault:8200")
+        addrinfo = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("172.20.1.5", 8200))]
+
+        with patch('socket.getaddrinfo', return_value=addrinfo) as lookup:
+            base_url, headers = await client._resolve_base_url()
+
+        lookup.assert_called_once()
+        assert base_url == "http://172.20.1.5:8200"
+        assert headers == {"Host": "vault:8200"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("addr", ["https://vault:8200", "http://127.0.0.1:8200"])
+    async def test_tls_and_literal_addresses_not_pinned(self, addr):
+        """Test that TLS and IP-literal addresses are used unchanged"""
+        client = self._client_for(addr)
+
+        with patch('socket.getaddrinfo') as lookup:
+            assert await client._resolve_base_url() == (addr, {})
+
+        lookup.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lookup_failure_falls_back_to_hostname(self):
+        """Test that a failed lookup keeps the configured address"""
+        client = self._client_for("http://vault:8200")
+
+        with patch('socket.getaddrinfo', side_effect=socket.gaierror):
+            assert await client._resolve_base_url() == ("http://vault:8200", {})
+
+    @pytest.mark.asyncio
+    async def test_stale_pinned_address_resolved_again(self, mock_httpx_client):
+        """Test that a connection failure on a pinned IP re-resolves the host and retries"""
+        client = self._client_for("http://vault:8200")
+        stale_client = AsyncMock()
+        stale_client.get.side_effect = httpx.ConnectError("Connection refused")
+        lookups = [
+            [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("172.20.1.5", 8200))],
+            [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("172.20.1.9", 8200))],
+        ]
+
+        with patch('socket.getaddrinfo', side_effect=lookups), \
+                patch('httpx.AsyncClient', side_effect=[stale_client, mock_httpx_client]) as factory:
+            assert await client.get_secret("postgres") == {"key": "value"}
+
+        assert [call.kwargs["base_url"] for call in factory.call_args_list] == [
+            "http://172.20.1.5:8200",
+            "http://172.20.1.9:8200",
+        ]
+        stale_client.aclose.assert_awaited_once()
+        assert client._client is mock_httpx_client
+
+    @pytest.mark.asyncio
+    async def test_unpinned_connection_error_not_retried(self):
+        """Test that a client using the hostname directly is not rebuilt on connection errors"""
+        client = self._client_for("http://vault:8200")
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = httpx.ConnectError("Connection refused")
+
+        with patch('httpx.AsyncClient', return_value=mock_client) as factory:
+            with pytest.raises(VaultUnavailableError):
+                await client.get_secret("postgres")
+
+        factory.assert_called_once()
+        assert mock_client.get.call_count == 1
+
+
+@pytest.mark.unit
+class TestVaultClientSecretCache:
+    """Test VaultClient in-process secret caching"""
+
+    @pytest.fixture
+    def vault_client(self):
+        """Create VaultClient instance"""
+        return VaultClient()
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_served_from_cache(self, vault_client, mock_httpx_client):
+        """Test that a cached secret does not hit Vault again"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            first = await vault_client.get_secret("postgres")
+            second = await vault_client.get_secret("postgres")
+
+        assert first == second == {"key": "value"}
+        assert mock_httpx_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_path_and_key(self, vault_client, mock_httpx_client):
+        """Test that different keys of the same secret are cached separately"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            await vault_client.get_secret("postgres")
+            await vault_client.get_secret("postgres", key="key")
+
+        assert mock_httpx_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_entry_expires_after_ttl(self, vault_client, mock_httpx_client):
+        """Test that entries older than the TTL are refetched"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client), \
+                patch('app.services.vault.time.monotonic', return_value=0.0) as clock:
+            await vault_client.get_secret("postgres")
+            clock.return_value = vault_client._cache_ttl + 1
+            await vault_client.get_secret("postgres")
+
+        assert mock_httpx_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_with_zero_ttl(self, vault_client, mock_httpx_client):
+        """Test that a TTL of zero always goes to Vault"""
+        vault_client._cache_ttl = 0
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            await vault_client.get_secret("postgres")
+            await vault_client.get_secret("postgres")
+
+        assert mock_httpx_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, vault_client, vault_404_response):
+        """Test that a failed read is retried on the next call"""
+        mock_client = AsyncMock()
+        mock_client.get.return_value = vault_404_response
+
+        with patch('httpx.AsyncClient', return_value=mock_client):
+            for _ in range(2):
+                with pytest.raises(ResourceNotFoundError):
+                    await vault_client.get_secret("missing")
+
+        assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_request(self, vault_client, mock_httpx_client):
+        """Test that concurrent reads of the same secret make a single Vault call"""
+        response = mock_httpx_client.get.return_value
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return response
+
+        mock_httpx_client.get.side_effect = slow_get
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            results = await asyncio.gather(*(vault_client.get_secret("postgres") for _ in range(5)))
+
+        assert all(result == {"key": "value"} for result in results)
+        assert mock_httpx_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_error(self, vault_client, vault_404_response):
+        """Test that waiters on a failed in-flight read all get its error"""
+        mock_client = AsyncMock()
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return vault_404_response
+
+        mock_client.get.side_effect = slow_get
+
+        with patch('httpx.AsyncClient', return_value=mock_client):
+            results = await asyncio.gather(
+                *(vault_client.get_secret("missing") for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(result, ResourceNotFoundError) for result in results)
+        assert mock_client.get.call_count == 1
+        assert vault_client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_caller_does_not_cancel_waiters(self, vault_client, mock_httpx_client):
+        """Test that cancelling the caller that started a read leaves other waiters served"""
+        response = mock_httpx_client.get.return_value
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return response
+
+        mock_httpx_client.get.side_effect = slow_get
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            first = asyncio.ensure_future(vault_client.get_secret("postgres"))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(vault_client.get_secret("postgres"))
+            await asyncio.sleep(0)
+            first.cancel()
+
+            assert await second == {"key": "value"}
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+        assert mock_httpx_client.get.call_count == 1
+        assert vault_client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cache_returns_copy(self, vault_client, mock_httpx_client):
+        """Test that mutating a returned secret does not corrupt the cache"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            secret = await vault_client.get_secret("postgres")
+            secret["key"] = "tampered"
+            assert await vault_client.get_secret("postgres") == {"key": "value"}
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_forces_refetch(self, vault_client, mock_httpx_client):
+        """Test that clear_cache() drops cached secrets"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            await vault_client.get_secret("postgres")
+            vault_client.clear_cache()
+            await vault_client.get_secret("postgres")
+
+        assert mock_httpx_client.get.call_count == 2
+
+
 @pytest.mark.integration
 class TestVaultServiceIntegration:
     """Integration tests for Vault service"""
@@ -292,7 +751,7 @@ class TestVaultServiceIntegration:
         mock_httpx = AsyncMock()
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "data": {
                 "data": {
                     "user": "integration_test_user",
@@ -300,7 +759,7 @@ class TestVaultServiceIntegration:
                     "host": "localhost"
                 }
             }
-        }
+        }).encode()
         mock_response.raise_for_status = MagicMock()
         mock_httpx.get.return_value = mock_response
         mock_httpx.__aenter__.return_value = mock_httpx
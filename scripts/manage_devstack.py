@@ -30,20 +30,28 @@ Author: DevStack Core Team
 License: MIT
 """
 
+import contextlib
+import functools
+import importlib.util
 import os
+import re
+import shlex
 import sys
 import subprocess
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Only click is imported eagerly (needed for the command decorators).
+# PyYAML, python-dotenv and Rich, as well as the heavier stdlib modules
+# (pickle, concurrent.futures), are imported by the functions that use
+# them, so commands such as --help, logs and shell don't pay their import
+# cost. Their presence is still checked up front so a missing package
+# gets the friendly message below.
 try:
     import click
-    import yaml
-    from rich.console import Console
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich import box
-    from dotenv import dotenv_values
+    for _module in ("yaml", "rich", "dotenv"):
+        if importlib.util.find_spec(_module) is None:
+            raise ImportError(f"No module named '{_module}'")
 except ImportError as e:
     print(f"Error: Missing required dependency: {e}")
     print("\nInstall Python dependencies with uv:")
@@ -55,6 +63,12 @@ except ImportError as e:
     print("\n(The wrapper script will automatically use the virtual environment)")
     sys.exit(1)
 
+# Optional: orjson decodes docker/colima JSON output faster than the stdlib
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 # ==============================================================================
 # Constants and Configuration
 # ==============================================================================
@@ -66,6 +80,11 @@ COMPOSE_FILE = SCRIPT_DIR / "docker-compose.yml"
 ENV_FILE = SCRIPT_DIR / ".env"
 PROFILES_DIR = SCRIPT_DIR / "configs" / "profiles"
 VAULT_CONFIG_DIR = Path.home() / ".config" / "vault"
+# Vault as reached from the host (compose publishes 8200:8200)
+VAULT_HOST_ADDR = "http://localhost:8200"
+COLIMA_HOME = Path(os.getenv("COLIMA_HOME", Path.home() / ".colima"))
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "devstack"
+PROFILES_CACHE_FILE = CACHE_DIR / "profiles.pkl"
 
 # Colima defaults (can be overridden by environment variables)
 COLIMA_PROFILE = os.getenv("COLIMA_PROFILE", "default")
@@ -73,8 +92,80 @@ COLIMA_CPU = os.getenv("COLIMA_CPU", "4")
 COLIMA_MEMORY = os.getenv("COLIMA_MEMORY", "8")
 COLIMA_DISK = os.getenv("COLIMA_DISK", "60")
 
-# Rich console for beautiful output
-console = Console()
+# Print the underlying docker commands (set DEVSTACK_VERBOSE=1)
+VERBOSE = bool(os.getenv("DEVSTACK_VERBOSE"))
+
+# Rich console for beautiful output (created on first use)
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Return the shared Rich console, importing rich.console on first call."""
+    from rich.console import Console
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _err_console():
+    """Return a Rich console on stderr, for commands whose stdout is data."""
+    from rich.console import Console
+    return Console(stderr=True)
+
+
+class _LazyConsole:
+    """Module-level stand-in that forwards attribute access to _console()."""
+
+    def __getattr__(self, name):
+        return getattr(_console(), name)
+
+
+console = _LazyConsole()
+
+# docker ps table used by status
+SERVICES_TABLE_FORMAT = "table {{.Names}}\t{{.Image}}\t{{.Status}}\t{{.Ports}}"
+
+# docker ps template emitting "service<TAB>state<TAB>status" per container.
+# Health is read from the status text, e.g. "Up 2 minutes (healthy)".
+HEALTH_PS_FORMAT = '{{.Label "com.docker.compose.service"}}\t{{.State}}\t{{.Status}}'
+_HEALTH_STATUS_RE = re.compile(r"\((?:health: )?(healthy|unhealthy|starting)\)")
+
+# Session settings for every restore connection (psql and each pg_restore
+# worker), passed via PGOPTIONS. Commits don't wait for the WAL flush, and
+# index builds/sorts get more memory, sized so -j 4 fits the container's
+# 2G limit. Losing the last few commits on a crash is fine mid-restore in a
+# dev stack: the restore is simply rerun.
+PG_RESTORE_OPTIONS = (
+    "-c synchronous_commit=off -c maintenance_work_mem=256MB "
+    "-c work_mem=64MB -c client_min_messages=warning"
+)
+
+# Services with credentials in Vault, in the order 'vault-show-password' lists
+# them, plus a set for membership checks
+_VAULT_SERVICES_DISPLAY = ("postgres", "mysql", "redis-1", "redis-2", "redis-3", "rabbitmq", "mongodb", "forgejo")
+_VALID_VAULT_SERVICES = frozenset(_VAULT_SERVICES_DISPLAY)
+
+# docker events template for 'health --watch': "service<TAB>action", where
+# action is e.g. "start", "die" or "health_status: healthy"
+HEALTH_EVENTS_FORMAT = '{{index .Actor.Attributes "com.docker.compose.service"}}\t{{.Action}}'
+
+# Container event -> state shown by 'health --watch'; "destroy" drops the row
+_EVENT_STATES = {
+    "create": "created",
+    "start": "running",
+    "unpause": "running",
+    "pause": "paused",
+    "die": "exited",
+}
+
+# Simple .env assignments: KEY=value or KEY="value", with an optional trailing
+# comment. Anything else (escapes, interpolation, single quotes) goes through
+# python-dotenv.
+_ENV_LINE_RE = re.compile(
+    r'(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)='
+    r'(?:"([^"\\$]*)"|([^\s"\'#$\\]*))'
+    r'(?:\s+#.*)?'
+)
+
+# Parsed profiles.yaml, keyed by path -> (st_mtime_ns, st_size, config)
+_PROFILES_CACHE: Dict[Path, Tuple[int, int, Dict]] = {}
 
 # ==============================================================================
 # Utility Functions
@@ -85,8 +176,9 @@ def run_command(
     check: bool = True,
     capture: bool = False,
     env: Optional[Dict[str, str]] = None,
-    input: Optional[str] = None
-) -> Tuple[int, str, str]:
+    input: Optional[str] = None,
+    decode: bool = True
+) -> Tuple[int, Union[str, bytes], Union[str, bytes]]:
     """
     Run a shell command with optional environment variables.
 
@@ -94,37 +186,50 @@ def run_command(
         cmd: Command and arguments as list
         check: Raise error if command fails
         capture: Capture stdout/stderr
-        env: Additional environment variables
+        env: Additional environment variables, layered over os.environ.
+            When omitted the child inherits the environment directly.
         input: Input data to send to stdin
+        decode: With capture, decode the output to str. Pass False to get
+            raw bytes, e.g. for JSON that is parsed straight from bytes.
 
     Returns:
         Tuple of (returncode, stdout, stderr)
     """
-    # Merge environment variables
-    cmd_env = os.environ.copy()
-    if env:
-        cmd_env.update(env)
+    # Merge environment variables; None lets the child inherit ours as-is
+    cmd_env = {**os.environ, **env} if env else None
 
+    # The CLI holds no descriptors that need hiding from children (and Python
+    # marks its own as non-inheritable anyway), so skip the close_fds sweep
+    # of the fd table; this also lets CPython use posix_spawn where it can.
     try:
         if capture:
             result = subprocess.run(
                 cmd,
                 check=check,
                 capture_output=True,
-                text=True,
+                text=decode,
                 env=cmd_env,
-                input=input
+                input=input if decode or input is None else input.encode(),
+                close_fds=False
             )
             return result.returncode, result.stdout, result.stderr
         else:
-            result = subprocess.run(cmd, check=check, env=cmd_env, input=input, text=True if input else False)
+            result = subprocess.run(
+                cmd,
+                check=check,
+                env=cmd_env,
+                input=input,
+                text=True if input else False,
+                close_fds=False
+            )
             return result.returncode, "", ""
     except subprocess.CalledProcessError as e:
         if check:
-            console.print(f"[red]Error running command: {' '.join(cmd)}[/red]")
+            console.print(f"[red]Error running command: {shlex.join(cmd)}[/red]")
             console.print(f"[red]Exit code: {e.returncode}[/red]")
             if capture and e.stderr:
-                console.print(f"[red]{e.stderr}[/red]")
+                stderr = e.stderr if decode else e.stderr.decode(errors="replace")
+                console.print(f"[red]{stderr}[/red]")
             sys.exit(e.returncode)
         return e.returncode, e.stdout if capture else "", e.stderr if capture else ""
     except FileNotFoundError:
@@ -133,46 +238,305 @@ def run_command(
         sys.exit(1)
 
 
+def stream_command(cmd: List[str]) -> Iterator[str]:
+    """
+    Run a command and yield its stdout line by line as it is produced.
+
+    Unlike run_command(capture=True), output is not buffered until the
+    process exits, so callers can render results incrementally. stderr is
+    discarded and a non-zero exit status simply ends the stream.
+
+    Args:
+        cmd: Command and arguments as list
+
+    Yields:
+        Lines of stdout, including the trailing newline
+    """
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            close_fds=False
+        )
+    except FileNotFoundError:
+        console.print(f"[red]Command not found: {cmd[0]}[/red]")
+        console.print(f"[yellow]Make sure {cmd[0]} is installed and in your PATH[/yellow]")
+        sys.exit(1)
+
+    with proc:
+        try:
+            yield from proc.stdout
+        finally:
+            # Stopped early (break, Ctrl+C): don't wait on a command that
+            # may never exit by itself, such as 'docker events'
+            if proc.poll() is None:
+                proc.terminate()
+
+
+def run_commands_parallel(cmds: List[List[str]]) -> List[Tuple[int, str, str]]:
+    """
+    Run independent commands concurrently, capturing their output.
+
+    Each command goes through run_command(check=False, capture=True) on its
+    own thread. The docker/colima CLIs mostly wait on their daemons, so N
+    calls take about as long as the slowest one rather than the sum.
+
+    Returns:
+        A (returncode, stdout, stderr) tuple per command, in input order
+    """
+    if len(cmds) < 2:
+        return [run_command(cmd, check=False, capture=True) for cmd in cmds]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(cmds)) as pool:
+        return list(pool.map(lambda cmd: run_command(cmd, check=False, capture=True), cmds))
+
+
+def project_container_ids(include_stopped: bool = False) -> List[str]:
+    """Return IDs of this compose project's containers (running only by default)."""
+    _, stdout, _ = run_command(
+        ["docker", "ps", "-aq" if include_stopped else "-q", "--filter", project_label_filter()],
+        capture=True,
+        check=False
+    )
+    return stdout.split()
+
+
+def container_running(name: str) -> bool:
+    """Whether the named container exists and is running (one engine API call)."""
+    returncode, stdout, _ = run_command(
+        ["docker", "inspect", "-f", "{{.State.Running}}", name],
+        capture=True,
+        check=False
+    )
+    return returncode == 0 and stdout.strip() == "true"
+
+
+def print_services_table() -> None:
+    """Print the project's running containers (name, status, ports) as a table."""
+    _, stdout, _ = run_command(
+        ["docker", "ps", "--filter", project_label_filter(), "--format", "{{.Names}}\t{{.Status}}\t{{.Ports}}"],
+        capture=True,
+        check=False
+    )
+    rows = [line.split("\t", 2) for line in stdout.splitlines() if line]
+    if not rows:
+        console.print("[yellow]No services running[/yellow]")
+        return
+
+    from rich import box
+    from rich.table import Table
+
+    table = Table(title=f"Running services ({len(rows)})", box=box.ROUNDED)
+    table.add_column("Container", style="cyan")
+    table.add_column("Status", style="green")
+    table.add_column("Ports", style="dim")
+    for row in sorted(rows):
+        table.add_row(*row)
+    console.print(table)
+
+
+def _read_profiles_pickle(st: os.stat_result) -> Optional[Dict]:
+    """Return the pickled profiles.yaml parse if it matches the current file stat."""
+    import pickle
+
+    try:
+        with open(PROFILES_CACHE_FILE, "rb") as f:
+            source, mtime_ns, size, config = pickle.load(f)
+    except Exception:
+        # Missing, truncated, or written by an incompatible version
+        return None
+
+    if (source, mtime_ns, size) != (str(PROFILES_FILE), st.st_mtime_ns, st.st_size):
+        return None
+    return config
+
+
+def _write_profiles_pickle(st: os.stat_result, config: Dict) -> None:
+    """Persist a parsed profiles.yaml for later CLI invocations (best effort)."""
+    import pickle
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = PROFILES_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(
+                (str(PROFILES_FILE), st.st_mtime_ns, st.st_size, config),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_file, PROFILES_CACHE_FILE)
+    except OSError:
+        pass
+
+
 def load_profiles_config() -> Dict:
-    """Load and parse profiles.yaml configuration."""
-    if not PROFILES_FILE.exists():
+    """
+    Load and parse profiles.yaml configuration.
+
+    The parsed result is cached for the lifetime of the process and, across
+    invocations, in a pickle under ~/.cache/devstack. Both caches are reused
+    only while the file's mtime and size are unchanged. Callers must treat
+    the returned dict as read-only.
+    """
+    try:
+        st = PROFILES_FILE.stat()
+    except FileNotFoundError:
         console.print(f"[red]Error: {PROFILES_FILE} not found[/red]")
         sys.exit(1)
 
-    with open(PROFILES_FILE) as f:
-        return yaml.safe_load(f)
+    cached = _PROFILES_CACHE.get(PROFILES_FILE)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    config = _read_profiles_pickle(st)
+    if config is None:
+        import yaml
+        # Prefer the libyaml-backed C loader; fall back to the pure-Python parser
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(PROFILES_FILE) as f:
+            config = yaml.load(f, Loader=loader)
+        _write_profiles_pickle(st, config)
+
+    # Flat name -> profile index over main and custom profiles (main wins)
+    if "_flat_profiles" not in config:
+        config["_flat_profiles"] = {
+            **(config.get("custom_profiles") or {}),
+            **(config.get("profiles") or {})
+        }
+
+    _PROFILES_CACHE[PROFILES_FILE] = (st.st_mtime_ns, st.st_size, config)
+    return config
+
+
+@functools.lru_cache(maxsize=32)
+def _load_env_cached(path: str, mtime_ns: int, size: int) -> Dict[str, str]:
+    """
+    Parse a .env file, cached per (path, mtime, size).
+
+    Files made only of plain KEY=value / KEY="value" lines are parsed with
+    _ENV_LINE_RE; any other syntax falls back to python-dotenv for the
+    whole file.
+    """
+    env = {}
+    for line in Path(path).read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        match = _ENV_LINE_RE.fullmatch(line)
+        if match is None:
+            from dotenv import dotenv_values
+            return dotenv_values(path)
+
+        key, quoted, bare = match.groups()
+        env[key] = quoted if quoted is not None else bare
+
+    return env
+
+
+def compose_project_name() -> str:
+    """
+    Return the Docker Compose project name, resolved the way compose does.
+
+    COMPOSE_PROJECT_NAME from the environment wins, then the one set in the
+    project .env, then the project directory name.
+    """
+    name = os.getenv("COMPOSE_PROJECT_NAME")
+    if not name:
+        try:
+            st = ENV_FILE.stat()
+        except FileNotFoundError:
+            pass
+        else:
+            name = _load_env_cached(str(ENV_FILE), st.st_mtime_ns, st.st_size).get("COMPOSE_PROJECT_NAME")
+    return name or re.sub(r"[^a-z0-9_-]", "", SCRIPT_DIR.name.lower())
+
+
+def project_label_filter() -> str:
+    """
+    Return the docker --filter selecting this project's containers.
+
+    The plain docker CLI starts far faster than 'docker compose', so commands
+    that only list, exec into, or signal containers select the project's
+    containers by the label compose puts on them.
+    """
+    return f"label=com.docker.compose.project={compose_project_name()}"
 
 
 def load_profile_env(profile: str) -> Dict[str, str]:
     """Load environment variables from a profile .env file."""
     profile_env_file = PROFILES_DIR / f"{profile}.env"
 
-    if not profile_env_file.exists():
+    try:
+        st = profile_env_file.stat()
+    except FileNotFoundError:
         return {}
 
-    # Use python-dotenv to parse .env file
-    return dotenv_values(profile_env_file)
+    # Keyed like the profiles.yaml cache so an edit within the same mtime
+    # tick is still picked up. Callers must treat the result as read-only.
+    return _load_env_cached(str(profile_env_file), st.st_mtime_ns, st.st_size)
 
 
 def get_profile_services(profile: str) -> List[str]:
     """Get list of services for a given profile."""
-    profiles_config = load_profiles_config()
-
-    # Check in main profiles
-    if profile in profiles_config.get("profiles", {}):
-        return profiles_config["profiles"][profile].get("services", [])
-
-    # Check in custom profiles
-    if profile in profiles_config.get("custom_profiles", {}):
-        return profiles_config["custom_profiles"][profile].get("services", [])
+    entry = load_profiles_config()["_flat_profiles"].get(profile)
+    if entry is not None:
+        return entry.get("services", [])
 
     console.print(f"[red]Error: Unknown profile '{profile}'[/red]")
     console.print("[yellow]Available profiles: minimal, standard, full, reference[/yellow]")
     sys.exit(1)
 
 
+def _colima_pid_alive(profile: str) -> Optional[bool]:
+    """
+    Check the Colima VM's Lima host agent pid file without running colima.
+
+    Colima runs its VM as the Lima instance "colima" (default profile) or
+    "colima-<profile>", whose host agent writes ha.pid while the VM is up.
+
+    Returns:
+        True/False if the pid file was found and probed, or None when the
+        pid file is missing or unreadable and the caller should fall back
+        to 'colima status'
+    """
+    instance = "colima" if profile == "default" else f"colima-{profile}"
+    pid_file = COLIMA_HOME / "_lima" / instance / "ha.pid"
+    try:
+        pid = int(pid_file.read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Process exists but belongs to another user
+        return True
+    return True
+
+
+@functools.lru_cache(maxsize=1)
 def check_colima_status() -> bool:
-    """Check if Colima is running."""
+    """
+    Check if Colima is running.
+
+    Probes the Lima host agent pid file first and only spawns
+    'colima status' when that isn't conclusive. The result is cached for
+    the rest of the process, since the VM state doesn't change within a
+    single command unless the command itself starts or stops it; commands
+    that do must call check_colima_status.cache_clear() afterwards.
+    """
+    alive = _colima_pid_alive(COLIMA_PROFILE)
+    if alive is not None:
+        return alive
+
     returncode, stdout, stderr = run_command(
         ["colima", "status", "-p", COLIMA_PROFILE],
         check=False,
@@ -183,18 +547,483 @@ def check_colima_status() -> bool:
     return returncode == 0 and "running" in output
 
 
-def check_vault_token() -> bool:
-    """Check if Vault root token exists."""
-    token_file = VAULT_CONFIG_DIR / "root-token"
-    return token_file.exists()
+@functools.lru_cache(maxsize=1)
+def get_vault_token() -> Optional[str]:
+    """Get Vault root token, or None if the token file doesn't exist."""
+    try:
+        return (VAULT_CONFIG_DIR / "root-token").read_text().strip()
+    except FileNotFoundError:
+        return None
 
 
-def get_vault_token() -> Optional[str]:
-    """Get Vault root token."""
-    token_file = VAULT_CONFIG_DIR / "root-token"
-    if not token_file.exists():
+@functools.lru_cache(maxsize=None)
+def _vault_api_get(path: str, token: str) -> Dict[str, str]:
+    """
+    Read a secret/ KV entry through Vault's HTTP API on the published port.
+
+    This skips the 'docker exec dev-vault vault kv get' round trip, and each
+    path is fetched at most once per process, so asking for several fields
+    of the same secret costs a single request. Raises OSError or ValueError
+    on failure; failures aren't cached.
+    """
+    import urllib.request
+
+    request = urllib.request.Request(
+        f"{VAULT_HOST_ADDR}/v1/secret/data/{path}",
+        headers={"X-Vault-Token": token}
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return _json.loads(response.read())["data"]["data"]
+
+
+def _vault_kv_get_json(path: str) -> Optional[Dict[str, str]]:
+    """
+    Read every field of secret/<path> with one 'vault kv get -format=json'.
+
+    Runs inside dev-vault with the host's root token, forwarded through the
+    environment ('-e VAULT_TOKEN' without a value) so it never appears in
+    the process list. Returns None if the token is missing or the read
+    fails.
+    """
+    token = get_vault_token()
+    if not token:
+        return None
+
+    returncode, stdout, _ = run_command(
+        ["docker", "exec", "-e", "VAULT_TOKEN", "-e", "VAULT_ADDR", "dev-vault",
+         "vault", "kv", "get", "-format=json", f"secret/{path}"],
+        capture=True,
+        check=False,
+        env={"VAULT_TOKEN": token, "VAULT_ADDR": "http://127.0.0.1:8200"},
+        decode=False
+    )
+    if returncode != 0:
+        return None
+    try:
+        return _json.loads(stdout)["data"]["data"]
+    except (ValueError, KeyError, TypeError):
         return None
-    return token_file.read_text().strip()
+
+
+def _get_mysql_backup_password() -> str:
+    """Read the MySQL root password from Vault ("" if unavailable)."""
+    token = get_vault_token()
+    if not token:
+        return ""
+
+    try:
+        return _vault_api_get("mysql", token).get("password", "")
+    except (OSError, ValueError, KeyError, TypeError):
+        return ""
+
+
+# Backup workers used by 'backup'. Each writes one file into backup_dir and
+# returns the status line shown in the progress display.
+
+# Suffixes a backup file may carry, in the order restore looks for them
+BACKUP_SUFFIXES = ("", ".zst", ".gz")
+
+
+@functools.lru_cache(maxsize=None)
+def _backup_compressor() -> Optional[Tuple[List[str], str]]:
+    """
+    Pick the host compressor for dumps: (command, file suffix), or None.
+
+    zstd on all cores at its default level keeps up with the dump tools
+    while shrinking SQL text 5-10x; gzip (pigz where installed, which uses
+    every core) is the fallback where zstd isn't installed.
+    """
+    import shutil
+
+    if shutil.which("zstd"):
+        return ["zstd", "-T0", "-q", "-c"], ".zst"
+    gzip = shutil.which("pigz") or shutil.which("gzip")
+    if gzip:
+        return [gzip, "-c"], ".gz"
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _decompress_cmd(suffix: str) -> Optional[List[str]]:
+    """Host command that decompresses a .zst/.gz backup to stdout, or None."""
+    if suffix == ".zst":
+        return ["zstd", "-dcq"]
+    if suffix == ".gz":
+        import shutil
+        return [shutil.which("pigz") or "gzip", "-dc"]
+    return None
+
+
+def _dump_to_file(
+    cmd: List[str],
+    dest: Path,
+    compress: bool = False,
+    env: Optional[Dict[str, str]] = None
+) -> bool:
+    """
+    Run a dump command with its stdout written straight to dest.
+
+    The output never passes through Python, so memory use stays flat no
+    matter how large the dump is, and bytes are written exactly as the
+    tool produced them. With compress=True the output is piped through
+    _backup_compressor() first and dest gains its suffix. env is layered
+    over os.environ for the dump command, as in run_command(). A failed
+    dump's partial file is removed.
+    """
+    cmd_env = {**os.environ, **env} if env else None
+    compressor = _backup_compressor() if compress else None
+    if compressor:
+        compress_cmd, suffix = compressor
+        dest = dest.with_name(dest.name + suffix)
+
+    with open(dest, "wb") as f:
+        if compressor:
+            dump = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=cmd_env,
+                close_fds=False
+            )
+            packer = subprocess.Popen(
+                compress_cmd,
+                stdin=dump.stdout,
+                stdout=f,
+                stderr=subprocess.DEVNULL,
+                close_fds=False
+            )
+            # Drop our copy of the pipe so the dump sees SIGPIPE if the
+            # compressor dies
+            dump.stdout.close()
+            # Reap both; a failed dump is the root cause, so it is reported first
+            packer_rc, dump_rc = packer.wait(), dump.wait()
+            returncode = dump_rc or packer_rc
+        else:
+            returncode = subprocess.run(
+                cmd,
+                stdout=f,
+                stderr=subprocess.DEVNULL,
+                env=cmd_env,
+                check=False,
+                close_fds=False
+            ).returncode
+    if returncode != 0:
+        dest.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _find_backup_file(backup_dir: Path, name: str) -> Optional[Path]:
+    """Return name in backup_dir, as stored plain or compressed, if present."""
+    for suffix in BACKUP_SUFFIXES:
+        path = backup_dir / f"{name}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def _copy_file(src: Path, dest: Path) -> None:
+    """
+    Copy src to dest in the kernel, keeping src's permission bits.
+
+    Uses os.sendfile on Linux, which copies without a userspace buffer. Other
+    platforms (macOS only supports sendfile to sockets) fall back to
+    shutil.copyfile, which uses the native fast path where there is one.
+    """
+    with open(src, "rb") as fsrc:
+        st = os.fstat(fsrc.fileno())
+        # Create dest with src's mode so a 0600 .env never sits world-readable
+        fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, st.st_mode & 0o777)
+        with open(fd, "wb") as fdst:
+            os.chmod(fdst.fileno(), st.st_mode & 0o777)
+            if sys.platform.startswith("linux"):
+                offset = 0
+                while offset < st.st_size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, st.st_size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+
+    import shutil
+    shutil.copyfile(src, dest)
+
+
+def _dir_size(path: Union[str, Path]) -> int:
+    """Total size in bytes of the regular files under path (symlinks not followed)."""
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+            elif entry.is_dir(follow_symlinks=False):
+                total += _dir_size(entry.path)
+    return total
+
+
+def _format_size(size: int) -> str:
+    """Format a byte count the way 'du -h' does, e.g. 512B, 1.5K, 12G."""
+    for unit in ("B", "K", "M", "G", "T"):
+        if size < 1024 or unit == "T":
+            break
+        size /= 1024
+    return f"{size}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+
+
+def _restore_from_file(
+    cmd: List[str],
+    path: Path,
+    quiet: bool = True,
+    env: Optional[Dict[str, str]] = None
+) -> int:
+    """
+    Run a restore command with a backup file streamed into its stdin.
+
+    Plain files are handed to the command as its stdin directly; .zst/.gz
+    files written by backup are decompressed by zstd/gzip piped in front of
+    it. Either way the dump never passes through Python, so memory use is
+    flat and the restore starts before the file has been read. The
+    command's stdout is discarded; with quiet=False its errors still go to
+    the terminal. env is layered over os.environ for the restore command.
+
+    Returns:
+        The restore command's exit status (or the decompressor's, if only
+        that failed)
+    """
+    errors = subprocess.DEVNULL if quiet else None
+    cmd_env = {**os.environ, **env} if env else None
+    decompress_cmd = _decompress_cmd(path.suffix)
+
+    with open(path, "rb") as f:
+        if decompress_cmd is None:
+            return subprocess.run(
+                cmd,
+                stdin=f,
+                stdout=subprocess.DEVNULL,
+                stderr=errors,
+                env=cmd_env,
+                check=False,
+                close_fds=False
+            ).returncode
+
+        unpack = subprocess.Popen(
+            decompress_cmd,
+            stdin=f,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=False
+        )
+        restore = subprocess.Popen(
+            cmd,
+            stdin=unpack.stdout,
+            stdout=subprocess.DEVNULL,
+            stderr=errors,
+            env=cmd_env,
+            close_fds=False
+        )
+        # Only the two children hold the pipe now, so the decompressor sees
+        # SIGPIPE if the restore exits early
+        unpack.stdout.close()
+        # Reap both before returning; the restore's failure is the one to report
+        restore_rc, unpack_rc = restore.wait(), unpack.wait()
+        return restore_rc or unpack_rc
+
+
+def _backup_postgres(backup_dir: Path) -> str:
+    # Roles and other cluster-wide objects go in postgres_globals.sql, then
+    # each database gets a custom-format archive (postgres_<db>.dump), which
+    # pg_restore can load in parallel. -Fc output is already compressed.
+    returncode, stdout, _ = run_command(
+        ["docker", "exec", "dev-postgres", "psql", "-U", "dev_admin", "-d", "postgres", "-AtX",
+         "-c", "SELECT datname FROM pg_database WHERE datallowconn AND NOT datistemplate"],
+        capture=True,
+        check=False
+    )
+    databases = stdout.split()
+    if returncode != 0 or not databases:
+        return "[yellow]⚠ PostgreSQL backup failed[/yellow]"
+
+    if not _dump_to_file(
+        ["docker", "exec", "dev-postgres", "pg_dumpall", "-U", "dev_admin", "--globals-only"],
+        backup_dir / "postgres_globals.sql",
+        compress=True
+    ):
+        return "[yellow]⚠ PostgreSQL backup failed[/yellow]"
+
+    for db in databases:
+        if not _dump_to_file(
+            ["docker", "exec", "dev-postgres", "pg_dump", "-U", "dev_admin", "-Fc", "-d", db],
+            backup_dir / f"postgres_{db}.dump"
+        ):
+            return f"[yellow]⚠ PostgreSQL backup failed ({db})[/yellow]"
+    return "[green]✓ PostgreSQL backed up[/green]"
+
+
+def _backup_mysql(backup_dir: Path, mysql_pass: str) -> str:
+    if not mysql_pass:
+        return "[yellow]⚠ MySQL backup skipped (no password)[/yellow]"
+
+    # MYSQL_PWD is forwarded from our environment ('-e' without a value), so
+    # the password stays out of every argv and needs no shell quoting
+    if _dump_to_file(
+        ["docker", "exec", "-e", "MYSQL_PWD", "dev-mysql",
+         "mysqldump", "-u", "root", "--all-databases"],
+        backup_dir / "mysql_all.sql",
+        compress=True,
+        env={"MYSQL_PWD": mysql_pass}
+    ):
+        return "[green]✓ MySQL backed up[/green]"
+    return "[yellow]⚠ MySQL backup failed[/yellow]"
+
+
+def _backup_mongodb(backup_dir: Path) -> str:
+    try:
+        if _dump_to_file(
+            ["docker", "exec", "dev-mongodb", "mongodump", "--archive"],
+            backup_dir / "mongodb_dump.archive",
+            compress=True
+        ):
+            return "[green]✓ MongoDB backed up[/green]"
+        return "[yellow]⚠ MongoDB backup failed[/yellow]"
+    except Exception as e:
+        return f"[yellow]⚠ MongoDB backup error: {e}[/yellow]"
+
+
+def _backup_forgejo(backup_dir: Path) -> str:
+    try:
+        if _dump_to_file(
+            ["docker", "exec", "dev-forgejo", "tar", "cf", "-", "/data"],
+            backup_dir / "forgejo_data.tar",
+            compress=True
+        ):
+            return "[green]✓ Forgejo backed up[/green]"
+        return "[yellow]⚠ Forgejo backup failed[/yellow]"
+    except Exception as e:
+        return f"[yellow]⚠ Forgejo backup error: {e}[/yellow]"
+
+
+# Restore workers used by 'restore', the counterparts of the backup workers.
+# Each streams one backup file into its service and returns a status line.
+
+def _restore_postgres(backup_dir: Path, jobs: int) -> str:
+    try:
+        dumps = sorted(backup_dir.glob("postgres_*.dump"))
+        if not dumps:
+            # Plain pg_dumpall SQL from older backups: one serial psql stream
+            if _restore_from_file(
+                ["docker", "compose", "exec", "-T", "-e", f"PGOPTIONS={PG_RESTORE_OPTIONS}",
+                 "postgres", "psql", "-U", "dev_admin", "postgres"],
+                _find_backup_file(backup_dir, "postgres_all.sql"),
+                quiet=False
+            ) == 0:
+                return "[green]✓ PostgreSQL restored[/green]"
+            return "[yellow]⚠ PostgreSQL restore failed[/yellow]"
+
+        # Roles first, so restored objects keep their owners. Roles that
+        # already exist just produce errors psql skips past.
+        globals_backup = _find_backup_file(backup_dir, "postgres_globals.sql")
+        if globals_backup:
+            _restore_from_file(
+                ["docker", "compose", "exec", "-T", "-e", f"PGOPTIONS={PG_RESTORE_OPTIONS}",
+                 "postgres", "psql", "-U", "dev_admin", "postgres"],
+                globals_backup
+            )
+
+        failed = []
+        for dump in dumps:
+            db = dump.stem[len("postgres_"):]
+            # pg_restore -j needs a seekable file, not a pipe, so the archive
+            # is copied into the container and restored from there
+            target = f"/tmp/{dump.name}"
+            returncode, _, _ = run_command(
+                ["docker", "cp", str(dump), f"dev-postgres:{target}"],
+                capture=True,
+                check=False
+            )
+            if returncode == 0:
+                returncode, _, _ = run_command(
+                    ["docker", "exec", "-e", f"PGOPTIONS={PG_RESTORE_OPTIONS}", "dev-postgres", "sh", "-c",
+                     'createdb -U dev_admin "$1" 2>/dev/null; '
+                     'pg_restore -U dev_admin -j "$2" --clean --if-exists -d "$1" "$3"; '
+                     'rc=$?; rm -f "$3"; exit $rc',
+                     "_", db, str(jobs), target],
+                    check=False
+                )
+            if returncode != 0:
+                failed.append(db)
+
+        if failed:
+            return f"[yellow]⚠ PostgreSQL restore failed ({', '.join(failed)})[/yellow]"
+        return "[green]✓ PostgreSQL restored[/green]"
+    except Exception as e:
+        return f"[red]✗ PostgreSQL restore error: {e}[/red]"
+
+
+def _restore_mysql(path: Path, mysql_pass: str) -> str:
+    if not mysql_pass:
+        return "[yellow]⚠ MySQL restore skipped (no password)[/yellow]"
+
+    try:
+        # MYSQL_PWD is forwarded as in _backup_mysql
+        if _restore_from_file(
+            ["docker", "exec", "-i", "-e", "MYSQL_PWD", "dev-mysql", "mysql", "-u", "root"],
+            path,
+            quiet=False,
+            env={"MYSQL_PWD": mysql_pass}
+        ) == 0:
+            return "[green]✓ MySQL restored[/green]"
+        return "[yellow]⚠ MySQL restore failed[/yellow]"
+    except Exception as e:
+        return f"[red]✗ MySQL restore error: {e}[/red]"
+
+
+def _restore_mongodb(path: Path) -> str:
+    try:
+        if _restore_from_file(
+            ["docker", "compose", "exec", "-T", "mongodb", "mongorestore", "--archive", "--drop"],
+            path
+        ) == 0:
+            return "[green]✓ MongoDB restored[/green]"
+        return "[yellow]⚠ MongoDB restore failed[/yellow]"
+    except Exception as e:
+        return f"[red]✗ MongoDB restore error: {e}[/red]"
+
+
+def _restore_forgejo(path: Path) -> str:
+    try:
+        # The tarball is decompressed on the host by _restore_from_file, so
+        # tar inside the container reads it uncompressed
+        if _restore_from_file(
+            ["docker", "compose", "exec", "-T", "forgejo", "sh", "-c", "rm -rf /data/* && tar xf - -C /"],
+            path
+        ) == 0:
+            return "[green]✓ Forgejo restored[/green]"
+        return "[yellow]⚠ Forgejo restore failed[/yellow]"
+    except Exception as e:
+        return f"[red]✗ Forgejo restore error: {e}[/red]"
+
+
+# Progress marker for an interrupted or partly failed restore, kept in the
+# backup directory. Services recorded as "ok" are skipped when the same
+# restore is retried; the file is removed once every service succeeds.
+RESTORE_STATE_FILE = ".restore_state.json"
+
+
+def _load_restore_state(backup_dir: Path) -> Dict[str, str]:
+    try:
+        state = _json.loads((backup_dir / RESTORE_STATE_FILE).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_restore_state(backup_dir: Path, state: Dict[str, str]) -> None:
+    import json
+    path = backup_dir / RESTORE_STATE_FILE
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state, indent=2))
+    # Atomic rename, so an interrupted write never leaves a truncated marker
+    os.replace(tmp, path)
 
 
 # ==============================================================================
@@ -226,6 +1055,7 @@ def cli():
       shell               Open interactive shell in a running container
       profiles            List all available service profiles with details
       ip                  Display Colima VM IP address
+      repl                Run commands interactively in one warm process
 
     \b
     DATA OPERATIONS
@@ -306,7 +1136,18 @@ def cli():
     help="Run services in background (detached mode)",
     show_default=True
 )
-def start(profile: Tuple[str], detach: bool):
+@click.option(
+    "--force-clean",
+    is_flag=True,
+    help="Run 'docker compose down' for all profiles before starting"
+)
+@click.option(
+    "--quiet",
+    "-q",
+    is_flag=True,
+    help="Don't list the running services afterwards"
+)
+def start(profile: Tuple[str], detach: bool, force_clean: bool, quiet: bool):
     """
     Start Colima VM and Docker services with specified profile(s).
 
@@ -317,6 +1158,9 @@ def start(profile: Tuple[str], detach: bool):
                               Available: minimal, standard, full, reference
       -d, --detach            Run services in background (detached mode) [default: True]
           --no-detach         Run services in foreground (attached mode)
+          --force-clean       Take down all existing project containers and
+                              networks (every profile) before starting
+      -q, --quiet             Don't list the running services afterwards
 
     \b
     PROFILES:
@@ -344,14 +1188,17 @@ def start(profile: Tuple[str], detach: bool):
       - Colima VM starts automatically if not running
       - After first start, run: ./manage-devstack vault-bootstrap
       - For standard/full profiles, run: ./manage-devstack redis-cluster-init
+      - Set DEVSTACK_VERBOSE=1 to print the docker compose command
+      - Only stopped/dead leftover containers are removed before starting;
+        use --force-clean for a full 'docker compose down' first
     """
     console.print("\n[cyan]═══ DevStack Core - Start Services ═══[/cyan]\n")
 
     # Validate profiles
     profiles_config = load_profiles_config()
+    flat_profiles = profiles_config["_flat_profiles"]
     for p in profile:
-        if p not in profiles_config.get("profiles", {}) and \
-           p not in profiles_config.get("custom_profiles", {}):
+        if p not in flat_profiles:
             console.print(f"[red]Error: Unknown profile '{p}'[/red]")
             console.print("\n[yellow]Available profiles:[/yellow]")
             for prof_name in profiles_config.get("profiles", {}).keys():
@@ -361,24 +1208,42 @@ def start(profile: Tuple[str], detach: bool):
     # Display what will start
     console.print(f"[green]Starting with profile(s):[/green] {', '.join(profile)}\n")
 
-    # Load profile environment variables
+    # Load profile environment variables. Files are read concurrently, then
+    # merged in command-line order so later profiles override earlier ones.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(profile)) as pool:
+        profile_envs = list(pool.map(load_profile_env, profile))
+
     merged_env = {}
-    for p in profile:
-        profile_env = load_profile_env(p)
+    for p, profile_env in zip(profile, profile_envs):
         merged_env.update(profile_env)
         if profile_env:
             console.print(f"[dim]Loaded {len(profile_env)} environment overrides from {p}.env[/dim]")
 
-    # Step 1: Check/Start Colima
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Checking Colima VM status...", total=None)
+    # Step 1: Check/Start Colima. The spinner only makes sense on a terminal;
+    # when output is piped (CI, tee) plain status lines are printed instead.
+    if console.is_terminal:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=_console()
+        )
+    else:
+        progress = None
+
+    with progress or contextlib.nullcontext():
+        if progress:
+            task = progress.add_task("Checking Colima VM status...", total=None)
+        else:
+            console.print("[dim]Checking Colima VM status...[/dim]")
 
         if not check_colima_status():
-            progress.update(task, description="Starting Colima VM...")
+            if progress:
+                progress.update(task, description="Starting Colima VM...")
+            else:
+                console.print("[dim]Starting Colima VM...[/dim]")
             run_command([
                 "colima", "start",
                 "-p", COLIMA_PROFILE,
@@ -387,44 +1252,57 @@ def start(profile: Tuple[str], detach: bool):
                 "--disk", COLIMA_DISK,
                 "--network-address"
             ], env=merged_env)
+            check_colima_status.cache_clear()
             console.print("[green]✓ Colima VM started[/green]")
         else:
-            progress.update(task, description="Colima VM already running")
+            if progress:
+                progress.update(task, description="Colima VM already running")
             console.print("[green]✓ Colima VM already running[/green]")
 
     # Step 2: Clean up any orphaned containers/networks from previous runs
-    console.print(f"\n[dim]Cleaning up orphaned resources...[/dim]")
+    console.print("\n[dim]Cleaning up orphaned resources...[/dim]")
 
-    # Stop and remove ALL containers/networks (use all possible profiles to ensure cleanup)
-    cleanup_cmd = ["docker", "compose"]
-    for prof in ["minimal", "standard", "full", "reference"]:
-        cleanup_cmd.extend(["--profile", prof])
-    cleanup_cmd.append("down")
-    run_command(cleanup_cmd, check=False)
+    if force_clean:
+        # Stop and remove ALL containers/networks (use all possible profiles to ensure cleanup)
+        run_command(
+            ["docker", "compose", "down"],
+            check=False,
+            env={"COMPOSE_PROFILES": "minimal,standard,full,reference"}
+        )
+    else:
+        # Only containers left stopped, dead, or never started by an earlier
+        # run need removing ('up' reconciles running ones), and usually there
+        # are none, so skip the compose round trip entirely
+        _, stdout, _ = run_command(
+            ["docker", "ps", "-aq", "--filter", project_label_filter(),
+             "--filter", "status=exited", "--filter", "status=dead", "--filter", "status=created"],
+            capture=True,
+            check=False
+        )
+        orphan_ids = stdout.split()
+        if orphan_ids:
+            run_command(["docker", "rm", "-f", *orphan_ids], check=False)
+            console.print(f"[dim]Removed {len(orphan_ids)} stale container(s)[/dim]")
 
     # Step 3: Start Docker services with profile(s)
-    console.print(f"\n[cyan]Starting Docker services...[/cyan]")
-
-    cmd = ["docker", "compose"]
-    for p in profile:
-        cmd.extend(["--profile", p])
-    cmd.extend(["up", "-d" if detach else ""])
+    console.print("\n[cyan]Starting Docker services...[/cyan]")
 
-    # Remove empty strings
-    cmd = [c for c in cmd if c]
+    # Profiles go to compose through COMPOSE_PROFILES rather than one
+    # --profile flag each; compose treats the two identically
+    compose_profiles = ",".join(profile)
+    cmd = ["docker", "compose", "up"]
+    if detach:
+        cmd.append("-d")
 
-    console.print(f"[dim]Command: {' '.join(cmd)}[/dim]\n")
-    run_command(cmd, env=merged_env)
+    if VERBOSE:
+        console.print(f"[dim]Command: COMPOSE_PROFILES={shlex.quote(compose_profiles)} {shlex.join(cmd)}[/dim]\n")
+    run_command(cmd, env={**merged_env, "COMPOSE_PROFILES": compose_profiles})
 
     # Step 4: Display running services
     console.print("\n[green]✓ Services started successfully[/green]\n")
 
-    # Show service status
-    _, stdout, _ = run_command(
-        ["docker", "compose", "ps", "--format", "table"],
-        capture=True
-    )
-    console.print(stdout)
+    if not quiet:
+        print_services_table()
 
     # Show next steps
     console.print("\n[cyan]Next Steps:[/cyan]")
@@ -447,7 +1325,20 @@ def start(profile: Tuple[str], detach: bool):
     multiple=True,
     help="Only stop services from specific profile(s)"
 )
-def stop(profile: Optional[Tuple[str]]):
+@click.option(
+    "--timeout",
+    "-t",
+    type=click.IntRange(min=0),
+    default=10,
+    help="Seconds to wait for each container to exit before killing it",
+    show_default=True
+)
+@click.option(
+    "--keep",
+    is_flag=True,
+    help="With --profile, stop the containers instead of removing them"
+)
+def stop(profile: Optional[Tuple[str]], timeout: int, keep: bool):
     """
     Stop Docker services and Colima VM.
 
@@ -456,10 +1347,15 @@ def stop(profile: Optional[Tuple[str]]):
       -p, --profile TEXT      Only stop services from specific profile(s)
                               Can specify multiple profiles
                               Available: minimal, standard, full, reference
+      -t, --timeout INTEGER   Seconds to wait for each container to exit
+                              before it is killed [default: 10]
+          --keep              With --profile, stop the containers but keep
+                              them (and their anonymous volumes) around
 
     \b
     BEHAVIOR:
-      - With --profile: Stops only services from specified profile(s)
+      - With --profile: Stops and removes only services from specified
+        profile(s); named data volumes are kept
       - Without --profile: Stops ALL services and Colima VM
 
     \b
@@ -473,10 +1369,20 @@ def stop(profile: Optional[Tuple[str]]):
       # Stop multiple profiles
       ./manage-devstack stop --profile standard --profile reference
 
+      # Fast stop when no database needs a clean shutdown
+      ./manage-devstack stop -t 1
+
+      # Stop a profile's containers without removing them
+      ./manage-devstack stop --profile reference --keep
+
     \b
     NOTES:
       - Use --profile to stop specific services while keeping others running
       - Without --profile, the Colima VM will be stopped completely
+      - Containers are stopped concurrently, so the grace period is paid
+        once rather than per container
+      - Removing (the --profile default) kills containers straight away, so
+        --timeout only applies to whole-stack stops and --keep
     """
     console.print("\n[cyan]═══ DevStack Core - Stop Services ═══[/cyan]\n")
 
@@ -485,19 +1391,14 @@ def stop(profile: Optional[Tuple[str]]):
         console.print(f"[yellow]Stopping profile(s):[/yellow] {', '.join(profile)}\n")
 
         # Load profiles.yaml to get service list
-        profiles_config = load_profiles_config()
+        flat_profiles = load_profiles_config()["_flat_profiles"]
         services_to_stop = []
 
         for p in profile:
-            if p in profiles_config.get('profiles', {}):
-                profile_services = profiles_config['profiles'][p].get('services', [])
-                services_to_stop.extend(profile_services)
-            elif p in profiles_config.get('custom_profiles', {}):
-                profile_services = profiles_config['custom_profiles'][p].get('services', [])
-                services_to_stop.extend(profile_services)
-            else:
+            if p not in flat_profiles:
                 console.print(f"[red]✗ Unknown profile:[/red] {p}")
                 return
+            services_to_stop.extend(flat_profiles[p].get('services', []))
 
         # Remove duplicates while preserving order
         services_to_stop = list(dict.fromkeys(services_to_stop))
@@ -506,22 +1407,37 @@ def stop(profile: Optional[Tuple[str]]):
             console.print(f"[dim]Stopping {len(services_to_stop)} services...[/dim]\n")
             # Convert service names to container names (dev-<service>)
             container_names = [f"dev-{svc}" for svc in services_to_stop]
-            cmd = ["docker", "stop"] + container_names
-            run_command(cmd, check=False)  # Don't fail if some containers aren't running
-            console.print(f"\n[green]✓ Stopped {len(services_to_stop)} services from profile(s): {', '.join(profile)}[/green]")
+            # 'rm -f' stops and removes in one daemon call; -v drops only
+            # anonymous volumes, the named data volumes survive
+            if keep:
+                cmd = ["docker", "stop", "-t", str(timeout)] + container_names
+            else:
+                cmd = ["docker", "rm", "-f", "-v"] + container_names
+            # Don't fail if some containers don't exist; docker echoes the
+            # name of each container it actually handled
+            _, stdout, _ = run_command(cmd, capture=True, check=False)
+            handled = list(dict.fromkeys(stdout.split()))
+            verb = "Stopped" if keep else "Removed"
+            console.print(f"[green]✓ {verb} {len(handled)} containers from profile(s): {', '.join(profile)}[/green]")
+            if handled:
+                console.print(f"[dim]{', '.join(handled)}[/dim]")
         else:
             console.print("[yellow]⚠ No services found for specified profile(s)[/yellow]")
     else:
         # Stop everything
         console.print("[yellow]Stopping all services and Colima VM...[/yellow]\n")
 
-        # Stop Docker services
-        run_command(["docker", "compose", "down"])
+        # Stop Docker services. The VM goes down next, so stopping the
+        # project's containers is enough; 'start' clears leftovers.
+        container_ids = project_container_ids()
+        if container_ids:
+            run_command(["docker", "stop", "-t", str(timeout), *container_ids])
         console.print("[green]✓ Docker services stopped[/green]")
 
         # Stop Colima
         if check_colima_status():
             run_command(["colima", "stop", "-p", COLIMA_PROFILE])
+            check_colima_status.cache_clear()
             console.print("[green]✓ Colima VM stopped[/green]")
         else:
             console.print("[dim]Colima VM was not running[/dim]")
@@ -538,18 +1454,18 @@ def status():
     """
     console.print("\n[cyan]═══ DevStack Core - Service Status ═══[/cyan]\n")
 
+    # The colima listing and the compose status are independent, so run
+    # them concurrently. The listing also tells us whether the VM is up,
+    # which saves a separate 'colima status' call.
+    (returncode, colima_stdout, _), (_, services_stdout, _) = run_commands_parallel([
+        ["colima", "list", "-p", COLIMA_PROFILE],
+        ["docker", "ps", "--filter", project_label_filter(), "--format", SERVICES_TABLE_FORMAT],
+    ])
+
     # Colima status
-    if check_colima_status():
+    if returncode == 0 and "running" in colima_stdout.lower():
         console.print("[green]✓ Colima VM:[/green] Running\n")
-
-        # Get Colima info
-        _, stdout, _ = run_command(
-            ["colima", "list", "-p", COLIMA_PROFILE],
-            capture=True,
-            check=False
-        )
-        if stdout:
-            console.print(stdout)
+        console.print(colima_stdout)
     else:
         console.print("[red]✗ Colima VM:[/red] Not running\n")
         console.print("[yellow]Start with:[/yellow] ./manage-devstack start\n")
@@ -558,14 +1474,9 @@ def status():
     # Docker services status
     console.print("[cyan]Docker Services:[/cyan]\n")
 
-    _, stdout, _ = run_command(
-        ["docker", "compose", "ps", "--format", "table"],
-        capture=True,
-        check=False
-    )
-
-    if stdout and "NAME" in stdout:
-        console.print(stdout)
+    # Anything beyond the header row means at least one container is up
+    if len(services_stdout.splitlines()) > 1:
+        console.print(services_stdout)
     else:
         console.print("[yellow]No services running[/yellow]")
         console.print("[dim]Start services with: ./manage-devstack start[/dim]")
@@ -574,11 +1485,18 @@ def status():
 
 
 @cli.command()
-def health():
+@click.option(
+    "--watch",
+    "-w",
+    is_flag=True,
+    help="Keep the table open and update it as container events arrive"
+)
+def health(watch: bool):
     """
     Check health status of all running services.
 
-    Performs health checks and displays results in a table.
+    Performs health checks and displays results in a table. With --watch
+    the table stays open and follows container events until Ctrl+C.
     """
     console.print("\n[cyan]═══ DevStack Core - Health Check ═══[/cyan]\n")
 
@@ -587,50 +1505,106 @@ def health():
         console.print("[yellow]Start with:[/yellow] ./manage-devstack start\n")
         return
 
-    # Get list of running containers
-    _, stdout, _ = run_command(
-        ["docker", "compose", "ps", "--format", "json"],
-        capture=True,
-        check=False
-    )
+    import time
+    from rich import box
+    from rich.live import Live
+    from rich.table import Table
+    from rich.text import Text
 
-    if not stdout:
-        console.print("[yellow]No services running[/yellow]\n")
-        return
+    # Prebuilt cells for the common values, so rows skip markup parsing
+    state_text = {"running": Text("running", style="green")}
+    health_text = {
+        "healthy": Text("healthy", style="green"),
+        "unknown": Text("no healthcheck", style="dim")
+    }
 
-    # Parse and check health
-    table = Table(title="Service Health Status", box=box.ROUNDED)
-    table.add_column("Service", style="cyan")
-    table.add_column("Status", style="green")
-    table.add_column("Health", style="yellow")
+    # service -> (state, health), in the order containers were listed
+    rows: Dict[str, Tuple[str, str]] = {}
 
-    import json
-    for line in stdout.strip().split("\n"):
-        try:
-            container = json.loads(line)
-            service = container.get("Service", "unknown")
-            state = container.get("State", "unknown")
-            health = container.get("Health", "unknown")
-
-            # Color code status
-            if state == "running":
-                status_display = "[green]running[/green]"
-            else:
-                status_display = f"[red]{state}[/red]"
+    def new_table() -> Table:
+        table = Table(title="Service Health Status", box=box.ROUNDED)
+        table.add_column("Service", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Health", style="yellow")
+        return table
 
-            # Color code health
-            if health == "healthy":
-                health_display = "[green]healthy[/green]"
-            elif health == "unknown":
-                health_display = "[dim]no healthcheck[/dim]"
-            else:
-                health_display = f"[yellow]{health}[/yellow]"
+    def add_row(table: Table, service: str, state: str, health: str) -> None:
+        # Color code status and health
+        status_display = state_text.get(state) or Text(state, style="red")
+        health_display = health_text.get(health) or Text(health, style="yellow")
+        table.add_row(service, status_display, health_display)
 
-            table.add_row(service, status_display, health_display)
-        except json.JSONDecodeError:
-            continue
+    # Events are replayed from just before the listing, so nothing that
+    # happens between the two calls is missed
+    since = str(int(time.time()))
+
+    # Parse and check health
+    table = new_table()
+
+    # A single streamed docker ps lists the project's running containers as
+    # service/state/status TSV, so there is no separate ID lookup or JSON to
+    # parse, and rows are rendered as they arrive.
+    live = Live(table, console=_console(), auto_refresh=False)
+    try:
+        for line in stream_command(
+            ["docker", "ps", "--filter", project_label_filter(), "--format", HEALTH_PS_FORMAT]
+        ):
+            fields = line.rstrip("\n").split("\t", 2)
+            if len(fields) != 3:
+                continue
+            service, state, status_text = fields
+            match = _HEALTH_STATUS_RE.search(status_text)
+            health = match.group(1) if match else "unknown"
+
+            rows[service] = (state, health)
+            add_row(table, service, state, health)
+            if not live.is_started:
+                live.start()
+            live.refresh()
+
+        if watch:
+            if not live.is_started:
+                live.start()
+                live.refresh()
+
+            # One long-lived 'docker events' stream instead of re-listing;
+            # the table is rebuilt only when a project container changes
+            for line in stream_command(
+                ["docker", "events", "--since", since,
+                 "--filter", "type=container", "--filter", project_label_filter(),
+                 "--format", HEALTH_EVENTS_FORMAT]
+            ):
+                service, _, action = line.rstrip("\n").partition("\t")
+                if not service:
+                    continue
+                state, health = rows.get(service, ("created", "unknown"))
+                if action.startswith("health_status: "):
+                    health = action[len("health_status: "):]
+                elif action == "destroy":
+                    if rows.pop(service, None) is None:
+                        continue
+                    state = None
+                elif action in _EVENT_STATES:
+                    state = _EVENT_STATES[action]
+                else:
+                    continue
+
+                if state is not None:
+                    rows[service] = (state, health)
+                table = new_table()
+                for row_service, (row_state, row_health) in rows.items():
+                    add_row(table, row_service, row_state, row_health)
+                live.update(table, refresh=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if live.is_started:
+            live.stop()
+
+    if not rows and not watch:
+        console.print("[yellow]No services running[/yellow]\n")
+        return
 
-    console.print(table)
     console.print()
 
 
@@ -688,7 +1662,12 @@ def logs(service: Optional[str], follow: bool, tail: int):
       - Use --follow to see logs as they are generated
       - Combine --follow and --tail to start from a specific point
     """
-    cmd = ["docker", "compose", "logs"]
+    # A single service is read straight from its container; only the
+    # interleaved all-services view needs compose.
+    if service:
+        cmd = ["docker", "logs"]
+    else:
+        cmd = ["docker", "compose", "logs"]
 
     if follow:
         cmd.append("-f")
@@ -696,7 +1675,7 @@ def logs(service: Optional[str], follow: bool, tail: int):
     cmd.extend(["--tail", str(tail)])
 
     if service:
-        cmd.append(service)
+        cmd.append(f"dev-{service}")
 
     try:
         run_command(cmd, check=False)
@@ -746,10 +1725,12 @@ def shell(service: str, shell: str):
       - Useful for manual inspection, debugging, or one-off commands
     """
     console.print(f"\n[cyan]Opening shell in {service}...[/cyan]")
-    console.print(f"[dim]Type 'exit' to close the shell[/dim]\n")
+    console.print("[dim]Type 'exit' to close the shell[/dim]\n")
 
+    # Containers are named dev-<service>; allocate a TTY only when we have one
+    exec_flags = "-it" if sys.stdin.isatty() else "-i"
     run_command(
-        ["docker", "compose", "exec", service, shell],
+        ["docker", "exec", exec_flags, f"dev-{service}", shell],
         check=False
     )
 
@@ -765,6 +1746,9 @@ def profiles():
     """
     console.print("\n[cyan]═══ DevStack Core - Service Profiles ═══[/cyan]\n")
 
+    from rich import box
+    from rich.table import Table
+
     profiles_config = load_profiles_config()
 
     # Main profiles table
@@ -795,35 +1779,65 @@ def profiles():
 
 
 @cli.command()
-def ip():
+@click.option(
+    "--quiet",
+    "-q",
+    is_flag=True,
+    help="Print only the address, for use in scripts"
+)
+def ip(quiet: bool):
     """
     Display Colima VM IP address.
 
     Useful for accessing services from libvirt VMs or other network clients.
+    With --quiet only the address is printed (errors go to stderr with a
+    non-zero exit status), e.g. IP=$(./manage-devstack ip -q).
     """
+    def fail(message: str) -> None:
+        if quiet:
+            click.echo(f"Error: {message}", err=True)
+            sys.exit(1)
+        console.print(f"[yellow]{message}[/yellow]\n")
+
     if not check_colima_status():
+        if quiet:
+            fail("Colima VM is not running")
         console.print("[red]Error: Colima VM is not running[/red]\n")
         return
 
     _, stdout, _ = run_command(
         ["colima", "ls", "-p", COLIMA_PROFILE, "-j"],
-        capture=True
+        capture=True,
+        decode=False
     )
 
     try:
-        import json
-        colima_info = json.loads(stdout)
-        if colima_info and isinstance(colima_info, dict):
-            ip_address = colima_info.get("address", "N/A")
-            console.print(f"\n[cyan]Colima VM IP:[/cyan] [green]{ip_address}[/green]\n")
-        else:
-            console.print("[yellow]Could not determine IP address[/yellow]\n")
-    except (json.JSONDecodeError, KeyError):
-        console.print("[yellow]Could not parse Colima info[/yellow]\n")
+        colima_info = _json.loads(stdout)
+    except _json.JSONDecodeError:
+        fail("Could not parse Colima info")
+        return
+
+    if not colima_info or not isinstance(colima_info, dict):
+        fail("Could not determine IP address")
+        return
+
+    ip_address = colima_info.get("address") or "N/A"
+    if quiet:
+        if ip_address == "N/A":
+            fail("Could not determine IP address")
+        click.echo(ip_address)
+    else:
+        console.print(f"\n[cyan]Colima VM IP:[/cyan] [green]{ip_address}[/green]\n")
 
 
 @cli.command()
-def restart():
+@click.option(
+    "--quiet",
+    "-q",
+    is_flag=True,
+    help="Don't list the running services afterwards"
+)
+def restart(quiet: bool):
     """
     Restart all Docker services without restarting Colima VM.
 
@@ -838,18 +1852,15 @@ def restart():
         return
 
     console.print("[yellow]Restarting Docker services...[/yellow]\n")
-    run_command(["docker", "compose", "restart"])
+    # Like 'compose restart', this covers stopped service containers too
+    container_ids = project_container_ids(include_stopped=True)
+    if container_ids:
+        run_command(["docker", "restart", *container_ids])
 
     console.print("\n[green]✓ Services restarted successfully[/green]\n")
 
-    # Show status
-    _, stdout, _ = run_command(
-        ["docker", "compose", "ps", "--format", "table"],
-        capture=True,
-        check=False
-    )
-    if stdout:
-        console.print(stdout)
+    if not quiet:
+        print_services_table()
 
     console.print()
 
@@ -889,6 +1900,7 @@ def reset():
     # Delete Colima VM
     console.print("[yellow]Deleting Colima VM...[/yellow]")
     run_command(["colima", "delete", "-p", COLIMA_PROFILE, "--force"])
+    check_colima_status.cache_clear()
 
     console.print("\n[green]✓ Colima VM has been reset[/green]")
     console.print("[cyan]Run './manage-devstack start' to create a fresh VM[/cyan]\n")
@@ -901,12 +1913,16 @@ def backup():
 
     \b
     Backup includes:
-      - PostgreSQL: Complete dump of all databases
+      - PostgreSQL: Roles plus a custom-format archive per database
       - MySQL: Complete dump of all databases
       - MongoDB: Binary archive dump
       - Forgejo: Tarball of /data directory (repos, uploads, config)
       - .env file: Configuration backup
 
+    \b
+    The dumps and the Forgejo tarball are compressed on the host with zstd
+    (.zst), or gzip (.gz) when zstd isn't installed; restore reads either.
+
     \b
     Backup location: ./backups/YYYYMMDD_HHMMSS/
     """
@@ -924,109 +1940,62 @@ def backup():
 
     console.print(f"[cyan]Creating backup in:[/cyan] {backup_dir}\n")
 
+    # Fetch the MySQL password up front so the dumps themselves don't wait on Vault
+    mysql_pass = _get_mysql_backup_password()
+
+    # The dumps are independent (separate containers, separate files), so
+    # run them concurrently; wall time is the slowest dump, not the sum.
+    jobs = {
+        "PostgreSQL": functools.partial(_backup_postgres, backup_dir),
+        "MySQL": functools.partial(_backup_mysql, backup_dir, mysql_pass),
+        "MongoDB": functools.partial(_backup_mongodb, backup_dir),
+        "Forgejo": functools.partial(_backup_forgejo, backup_dir),
+    }
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        # Backup PostgreSQL
-        task = progress.add_task("Backing up PostgreSQL...", total=None)
-        returncode, stdout, _ = run_command(
-            ["docker", "compose", "exec", "-T", "postgres", "pg_dumpall", "-U", "dev_admin"],
-            capture=True,
-            check=False
-        )
-        if returncode == 0:
-            (backup_dir / "postgres_all.sql").write_text(stdout)
-            progress.update(task, description="[green]✓ PostgreSQL backed up[/green]")
-        else:
-            progress.update(task, description="[yellow]⚠ PostgreSQL backup failed[/yellow]")
-
-        # Backup MySQL
-        task = progress.add_task("Backing up MySQL...", total=None)
-        # Get MySQL password from Vault
-        token = get_vault_token()
-        if token:
-            returncode, mysql_pass, _ = run_command(
-                ["docker", "exec", "dev-vault", "vault", "kv", "get", "-field=password", "secret/mysql"],
-                capture=True,
-                check=False,
-                env={"VAULT_TOKEN": token, "VAULT_ADDR": "http://localhost:8200"}
-            )
-            mysql_pass = mysql_pass.strip() if returncode == 0 else ""
-        else:
-            mysql_pass = ""
-
-        if mysql_pass:
-            returncode, stdout, _ = run_command(
-                ["docker", "compose", "exec", "-T", "mysql", "sh", "-c",
-                 f"mysqldump -u root -p'{mysql_pass}' --all-databases"],
-                capture=True,
-                check=False
-            )
-            if returncode == 0:
-                (backup_dir / "mysql_all.sql").write_text(stdout)
-                progress.update(task, description="[green]✓ MySQL backed up[/green]")
-            else:
-                progress.update(task, description="[yellow]⚠ MySQL backup failed[/yellow]")
-        else:
-            progress.update(task, description="[yellow]⚠ MySQL backup skipped (no password)[/yellow]")
-
-        # Backup MongoDB
-        task = progress.add_task("Backing up MongoDB...", total=None)
-        try:
-            result = subprocess.run(
-                ["docker", "compose", "exec", "-T", "mongodb", "mongodump", "--archive"],
-                capture_output=True,
-                check=False
-            )
-            if result.returncode == 0:
-                (backup_dir / "mongodb_dump.archive").write_bytes(result.stdout)
-                progress.update(task, description="[green]✓ MongoDB backed up[/green]")
-            else:
-                progress.update(task, description="[yellow]⚠ MongoDB backup failed[/yellow]")
-        except Exception as e:
-            progress.update(task, description=f"[yellow]⚠ MongoDB backup error: {e}[/yellow]")
-
-        # Backup Forgejo
-        task = progress.add_task("Backing up Forgejo...", total=None)
-        try:
-            result = subprocess.run(
-                ["docker", "compose", "exec", "-T", "forgejo", "tar", "czf", "-", "/data"],
-                capture_output=True,
-                check=False
-            )
-            if result.returncode == 0:
-                (backup_dir / "forgejo_data.tar.gz").write_bytes(result.stdout)
-                progress.update(task, description="[green]✓ Forgejo backed up[/green]")
-            else:
-                progress.update(task, description="[yellow]⚠ Forgejo backup failed[/yellow]")
-        except Exception as e:
-            progress.update(task, description=f"[yellow]⚠ Forgejo backup error: {e}[/yellow]")
+        console=_console()
+    ) as progress, ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        tasks = {
+            pool.submit(job): progress.add_task(f"Backing up {name}...", total=None)
+            for name, job in jobs.items()
+        }
+        for future in as_completed(tasks):
+            progress.update(tasks[future], description=future.result())
 
         # Backup .env file
         if ENV_FILE.exists():
-            import shutil
-            shutil.copy(ENV_FILE, backup_dir / ".env.backup")
+            _copy_file(ENV_FILE, backup_dir / ".env.backup")
             progress.add_task("[green]✓ .env file backed up[/green]", total=None)
 
     # Show backup size
     try:
-        result = subprocess.run(
-            ["du", "-sh", str(backup_dir)],
-            capture_output=True,
-            text=True
-        )
-        size = result.stdout.split()[0]
+        size = _format_size(_dir_size(backup_dir))
         console.print(f"\n[green]✓ Backup completed:[/green] {backup_dir}")
         console.print(f"[cyan]Backup size:[/cyan] {size}\n")
-    except Exception:
+    except OSError:
         console.print(f"\n[green]✓ Backup completed:[/green] {backup_dir}\n")
 
 
 @cli.command()
 @click.argument('backup_name', required=False)
-def restore(backup_name):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Parallel pg_restore jobs per PostgreSQL database",
+    show_default=True
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Restore every service, even those a previous attempt completed"
+)
+def restore(backup_name, jobs: int, force: bool):
     """
     Restore service data from a backup directory.
 
@@ -1041,7 +2010,10 @@ def restore(backup_name):
 
     \b
     OPTIONS:
-      None - This command uses an argument, not options
+      -j, --jobs INTEGER      Parallel pg_restore jobs per PostgreSQL
+                              database [default: 4]
+      --force                 Restore every service again, ignoring the
+                              progress marker left by an earlier attempt
 
     \b
     EXAMPLES:
@@ -1056,6 +2028,9 @@ def restore(backup_name):
       ./manage-devstack restore 20250110_143022 # Restore backup
       ./manage-devstack start                   # Restart services
 
+      # Retry after a partial failure, redoing everything
+      ./manage-devstack restore 20250110_143022 --force
+
     \b
     RESTORED DATA:
       - PostgreSQL: All databases and tables
@@ -1070,6 +2045,8 @@ def restore(backup_name):
       - Restoration will prompt for confirmation before proceeding
       - Services should be running during restore
       - Restart services after restore to pick up changes
+      - If some services fail, progress is kept in .restore_state.json in
+        the backup directory and a retry skips the ones already restored
     """
     console.print("\n[cyan]═══ DevStack Core - Restore ═══[/cyan]\n")
 
@@ -1077,13 +2054,24 @@ def restore(backup_name):
 
     # List available backups if no backup specified
     if not backup_name:
-        if not backups_dir.exists() or not list(backups_dir.iterdir()):
+        # DirEntry.is_dir() answers from the directory listing itself, and
+        # names (YYYYMMDD_HHMMSS) sort newest-first on their own
+        try:
+            with os.scandir(backups_dir) as entries:
+                backups = sorted(
+                    (entry for entry in entries if entry.is_dir()),
+                    key=lambda entry: entry.name,
+                    reverse=True
+                )
+        except FileNotFoundError:
+            backups = []
+
+        if not backups:
             console.print("[yellow]No backups found in ./backups/[/yellow]\n")
             console.print("[cyan]Create a backup first:[/cyan] ./manage-devstack backup\n")
             return
 
         console.print("[cyan]Available backups:[/cyan]\n")
-        backups = sorted([d for d in backups_dir.iterdir() if d.is_dir()], reverse=True)
 
         from rich.table import Table
         table = Table(show_header=True, header_style="bold cyan")
@@ -1092,25 +2080,18 @@ def restore(backup_name):
         table.add_column("Size", style="cyan")
 
         for backup in backups:
-            # Parse timestamp from directory name (YYYYMMDD_HHMMSS)
-            try:
-                from datetime import datetime
-                date_str = backup.name
-                dt = datetime.strptime(date_str, "%Y%m%d_%H%M%S")
-                formatted_date = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except Exception:
-                formatted_date = backup.name
+            # Format the timestamp in the directory name (YYYYMMDD_HHMMSS);
+            # it's fixed-width, so slicing beats a strptime round trip
+            name = backup.name
+            if len(name) == 15 and name[8] == "_" and name[:8].isdigit() and name[9:].isdigit():
+                formatted_date = f"{name[:4]}-{name[4:6]}-{name[6:8]} {name[9:11]}:{name[11:13]}:{name[13:]}"
+            else:
+                formatted_date = name
 
             # Get size
-            import subprocess
             try:
-                result = subprocess.run(
-                    ["du", "-sh", str(backup)],
-                    capture_output=True,
-                    text=True
-                )
-                size = result.stdout.split()[0]
-            except Exception:
+                size = _format_size(_dir_size(backup.path))
+            except OSError:
                 size = "Unknown"
 
             table.add_row(backup.name, formatted_date, size)
@@ -1136,120 +2117,72 @@ def restore(backup_name):
     console.print(f"[yellow]⚠️  WARNING: This will OVERWRITE current data with backup from {backup_name}[/yellow]\n")
     console.print("[red]This operation cannot be undone![/red]\n")
 
-    import click
     if not click.confirm("Are you sure you want to continue?", default=False):
         console.print("\n[yellow]Restore cancelled.[/yellow]\n")
         return
 
     console.print(f"\n[cyan]Restoring from:[/cyan] {backup_dir}\n")
 
+    # Each backup file goes to its own container with no dependency on the
+    # others, so restore them concurrently; wall time is the slowest restore.
+    workers = {}
+    if any(backup_dir.glob("postgres_*.dump")) or _find_backup_file(backup_dir, "postgres_all.sql"):
+        workers["PostgreSQL"] = functools.partial(_restore_postgres, backup_dir, jobs)
+    mysql_backup = _find_backup_file(backup_dir, "mysql_all.sql")
+    if mysql_backup:
+        # Fetched once, before the pool starts
+        mysql_pass = _get_mysql_backup_password()
+        workers["MySQL"] = functools.partial(_restore_mysql, mysql_backup, mysql_pass)
+    mongodb_backup = _find_backup_file(backup_dir, "mongodb_dump.archive")
+    if mongodb_backup:
+        workers["MongoDB"] = functools.partial(_restore_mongodb, mongodb_backup)
+    # .tar.zst/.tar.gz, or a .tar.gz gzipped in the container by older backups
+    forgejo_backup = _find_backup_file(backup_dir, "forgejo_data.tar")
+    if forgejo_backup:
+        workers["Forgejo"] = functools.partial(_restore_forgejo, forgejo_backup)
+
+    # Resume an earlier attempt that stopped part-way
+    state = {} if force else _load_restore_state(backup_dir)
+    skipped = [name for name in workers if state.get(name) == "ok"]
+    for name in skipped:
+        del workers[name]
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console
+        console=_console()
     ) as progress:
-        # Restore PostgreSQL
-        postgres_backup = backup_dir / "postgres_all.sql"
-        if postgres_backup.exists():
-            task = progress.add_task("Restoring PostgreSQL...", total=None)
-            try:
-                with open(postgres_backup, 'r') as f:
-                    returncode, _, _ = run_command(
-                        ["docker", "compose", "exec", "-T", "postgres", "psql", "-U", "dev_admin", "postgres"],
-                        capture=False,
-                        check=False,
-                        input=f.read()
-                    )
-                if returncode == 0:
-                    progress.update(task, description="[green]✓ PostgreSQL restored[/green]")
-                else:
-                    progress.update(task, description="[yellow]⚠ PostgreSQL restore failed[/yellow]")
-            except Exception as e:
-                progress.update(task, description=f"[red]✗ PostgreSQL restore error: {e}[/red]")
-
-        # Restore MySQL
-        mysql_backup = backup_dir / "mysql_all.sql"
-        if mysql_backup.exists():
-            task = progress.add_task("Restoring MySQL...", total=None)
-            # Get MySQL password from Vault
-            token = get_vault_token()
-            if token:
-                returncode, mysql_pass, _ = run_command(
-                    ["docker", "exec", "dev-vault", "vault", "kv", "get", "-field=password", "secret/mysql"],
-                    capture=True,
-                    check=False,
-                    env={"VAULT_TOKEN": token, "VAULT_ADDR": "http://localhost:8200"}
-                )
-                mysql_pass = mysql_pass.strip() if returncode == 0 else ""
-            else:
-                mysql_pass = ""
-
-            if mysql_pass:
-                try:
-                    with open(mysql_backup, 'r') as f:
-                        returncode, _, _ = run_command(
-                            ["docker", "compose", "exec", "-T", "mysql", "sh", "-c",
-                             f"mysql -u root -p'{mysql_pass}'"],
-                            capture=False,
-                            check=False,
-                            input=f.read()
-                        )
-                    if returncode == 0:
-                        progress.update(task, description="[green]✓ MySQL restored[/green]")
-                    else:
-                        progress.update(task, description="[yellow]⚠ MySQL restore failed[/yellow]")
-                except Exception as e:
-                    progress.update(task, description=f"[red]✗ MySQL restore error: {e}[/red]")
-            else:
-                progress.update(task, description="[yellow]⚠ MySQL restore skipped (no password)[/yellow]")
-
-        # Restore MongoDB
-        mongodb_backup = backup_dir / "mongodb_dump.archive"
-        if mongodb_backup.exists():
-            task = progress.add_task("Restoring MongoDB...", total=None)
-            try:
-                import subprocess
-                with open(mongodb_backup, 'rb') as f:
-                    result = subprocess.run(
-                        ["docker", "compose", "exec", "-T", "mongodb", "mongorestore", "--archive", "--drop"],
-                        input=f.read(),
-                        capture_output=True,
-                        check=False
-                    )
-                if result.returncode == 0:
-                    progress.update(task, description="[green]✓ MongoDB restored[/green]")
-                else:
-                    progress.update(task, description="[yellow]⚠ MongoDB restore failed[/yellow]")
-            except Exception as e:
-                progress.update(task, description=f"[red]✗ MongoDB restore error: {e}[/red]")
+        for name in skipped:
+            progress.add_task(
+                f"[dim]↷ {name} already restored (use --force to redo)[/dim]", total=None
+            )
 
-        # Restore Forgejo
-        forgejo_backup = backup_dir / "forgejo_data.tar.gz"
-        if forgejo_backup.exists():
-            task = progress.add_task("Restoring Forgejo...", total=None)
-            try:
-                import subprocess  # Explicit import to prevent UnboundLocalError
-                with open(forgejo_backup, 'rb') as f:
-                    result = subprocess.run(
-                        ["docker", "compose", "exec", "-T", "forgejo", "sh", "-c", "rm -rf /data/* && tar xzf - -C /"],
-                        input=f.read(),
-                        capture_output=True,
-                        check=False
-                    )
-                if result.returncode == 0:
-                    progress.update(task, description="[green]✓ Forgejo restored[/green]")
-                else:
-                    progress.update(task, description="[yellow]⚠ Forgejo restore failed[/yellow]")
-            except Exception as e:
-                progress.update(task, description=f"[red]✗ Forgejo restore error: {e}[/red]")
+        if workers:
+            with ThreadPoolExecutor(max_workers=len(workers)) as pool:
+                tasks = {
+                    pool.submit(worker): (name, progress.add_task(f"Restoring {name}...", total=None))
+                    for name, worker in workers.items()
+                }
+                for future in as_completed(tasks):
+                    name, task = tasks[future]
+                    status = future.result()
+                    progress.update(task, description=status)
+                    # Recorded from this thread only, as each service finishes
+                    state[name] = "ok" if status.startswith("[green]") else "failed"
+                    _save_restore_state(backup_dir, state)
+
+        # Nothing left to resume once every service is restored
+        if all(value == "ok" for value in state.values()):
+            (backup_dir / RESTORE_STATE_FILE).unlink(missing_ok=True)
 
         # Restore .env file
         env_backup = backup_dir / ".env.backup"
         if env_backup.exists():
             task = progress.add_task("Restoring .env file...", total=None)
             try:
-                import shutil
-                shutil.copy(env_backup, ENV_FILE)
+                _copy_file(env_backup, ENV_FILE)
                 progress.update(task, description="[green]✓ .env file restored[/green]")
             except Exception as e:
                 progress.update(task, description=f"[red]✗ .env restore error: {e}[/red]")
@@ -1285,6 +2218,8 @@ def vault_init():
 
     console.print("[yellow]Running Vault initialization script...[/yellow]\n")
     run_command(["bash", str(vault_init_script)])
+    # The script writes a new root token
+    get_vault_token.cache_clear()
     console.print()
 
 
@@ -1317,22 +2252,25 @@ def vault_unseal():
     console.print("[yellow]Unsealing Vault...[/yellow]\n")
 
     # Read keys file
-    import json
-    with open(vault_keys_file) as f:
-        keys_data = json.load(f)
-        unseal_keys = keys_data.get("unseal_keys_b64", [])[:3]
+    keys_data = _json.loads(vault_keys_file.read_bytes())
+    unseal_keys = keys_data.get("unseal_keys_b64", [])[:3]
 
     if len(unseal_keys) < 3:
         console.print(f"[red]Error: Not enough unseal keys in {vault_keys_file}[/red]\n")
         return
 
-    # Unseal with first 3 keys
-    for i, key in enumerate(unseal_keys, 1):
-        console.print(f"[dim]Unsealing with key {i}/3...[/dim]")
-        run_command(
-            ["docker", "exec", "dev-vault", "vault", "operator", "unseal", key],
-            check=False
-        )
+    # Unseal with first 3 keys, all inside a single container exec
+    console.print(f"[dim]Unsealing with keys 1-{len(unseal_keys)}...[/dim]")
+    returncode, _, _ = run_command(
+        ["docker", "exec", "dev-vault", "sh", "-c",
+         'for k in "$@"; do vault operator unseal "$k" || exit $?; done',
+         "_", *unseal_keys],
+        check=False
+    )
+
+    if returncode != 0:
+        console.print(f"\n[red]Error: Vault unseal failed (exit code {returncode})[/red]\n")
+        return
 
     console.print("\n[green]✓ Vault unsealed successfully[/green]\n")
 
@@ -1376,13 +2314,16 @@ def vault_token():
       export VAULT_TOKEN=$(./manage-devstack vault-token)
     """
     token_file = VAULT_CONFIG_DIR / "root-token"
-    if not token_file.exists():
-        console.print("[red]Error: Root token file not found[/red]", file=sys.stderr)
-        console.print("[yellow]Run './manage-devstack vault-init' first[/yellow]", file=sys.stderr)
+    try:
+        token = token_file.read_bytes().strip()
+    except FileNotFoundError:
+        _err_console().print("[red]Error: Root token file not found[/red]")
+        _err_console().print("[yellow]Run './manage-devstack vault-init' first[/yellow]")
         sys.exit(1)
 
-    # Print raw token to stdout (no formatting)
-    print(token_file.read_text().strip())
+    # Write the raw token to stdout (no decode, no formatting)
+    sys.stdout.buffer.write(token + b"\n")
+    sys.stdout.flush()
 
 
 @cli.command()
@@ -1470,14 +2411,17 @@ def vault_ca_cert():
     """
     ca_file = VAULT_CONFIG_DIR / "ca" / "ca-chain.pem"
 
-    if not ca_file.exists():
-        console.print(f"[red]Error: CA certificate not found at: {ca_file}[/red]", file=sys.stderr)
-        console.print("[yellow]Run './manage-devstack vault-bootstrap' first[/yellow]", file=sys.stderr)
+    try:
+        ca_chain = ca_file.read_bytes()
+    except FileNotFoundError:
+        _err_console().print(f"[red]Error: CA certificate not found at: {ca_file}[/red]")
+        _err_console().print("[yellow]Run './manage-devstack vault-bootstrap' first[/yellow]")
         sys.exit(1)
 
-    # Print raw certificate to stdout (no formatting)
-    print(ca_file.read_text())
-    console.print(f"\n[dim]CA certificate location: {ca_file}[/dim]", file=sys.stderr)
+    # Pass the PEM bytes straight through to stdout (no decode, no formatting)
+    sys.stdout.buffer.write(ca_chain)
+    sys.stdout.flush()
+    _err_console().print(f"\n[dim]CA certificate location: {ca_file}[/dim]")
 
 
 @cli.command()
@@ -1529,10 +2473,9 @@ def vault_show_password(service: str):
       - Redis nodes share the same password (stored in secret/redis-1)
     """
     # Validate service
-    valid_services = ["postgres", "mysql", "redis-1", "redis-2", "redis-3", "rabbitmq", "mongodb", "forgejo"]
-    if service not in valid_services:
+    if service not in _VALID_VAULT_SERVICES:
         console.print(f"[red]Error: Invalid service '{service}'[/red]")
-        console.print(f"\n[yellow]Available services:[/yellow] {', '.join(valid_services)}\n")
+        console.print(f"\n[yellow]Available services:[/yellow] {', '.join(_VAULT_SERVICES_DISPLAY)}\n")
         sys.exit(1)
 
     # Get token
@@ -1549,37 +2492,18 @@ def vault_show_password(service: str):
         # Get Forgejo credentials (username, email, password)
         console.print(f"[cyan]Fetching credentials for service: {service}[/cyan]\n")
 
-        _, admin_user, _ = run_command(
-            ["docker", "exec", "dev-vault", "sh", "-c",
-             f"export VAULT_TOKEN=$(cat /vault-keys/root-token) && vault kv get -field=admin_user secret/{service}"],
-            capture=True,
-            check=False
-        )
-
-        _, admin_email, _ = run_command(
-            ["docker", "exec", "dev-vault", "sh", "-c",
-             f"export VAULT_TOKEN=$(cat /vault-keys/root-token) && vault kv get -field=admin_email secret/{service}"],
-            capture=True,
-            check=False
-        )
-
-        _, password, _ = run_command(
-            ["docker", "exec", "dev-vault", "sh", "-c",
-             f"export VAULT_TOKEN=$(cat /vault-keys/root-token) && vault kv get -field=admin_password secret/{service}"],
-            capture=True,
-            check=False
-        )
-
-        admin_user = admin_user.strip()
-        admin_email = admin_email.strip()
-        password = password.strip()
+        # All three fields come back from a single read
+        secret = _vault_kv_get_json(service) or {}
+        admin_user = secret.get("admin_user") or ""
+        admin_email = secret.get("admin_email") or ""
+        password = secret.get("admin_password") or ""
 
-        if not admin_user or admin_user == "null" or not password or password == "null":
+        if not admin_user or not password:
             console.print(f"[red]Error: Could not retrieve credentials for {service}[/red]")
             console.print(f"[yellow]Make sure credentials exist: vault kv get secret/{service}[/yellow]\n")
             sys.exit(1)
 
-        console.print(f"[green]✓ Forgejo Admin Credentials:[/green]")
+        console.print("[green]✓ Forgejo Admin Credentials:[/green]")
         console.print(f"  [cyan]Username:[/cyan] {admin_user}")
         console.print(f"  [cyan]Email:[/cyan]    {admin_email}")
         console.print(f"  [cyan]Password:[/cyan] {password}\n")
@@ -1587,16 +2511,9 @@ def vault_show_password(service: str):
         # Get password for other services
         console.print(f"[cyan]Fetching password for service: {service}[/cyan]\n")
 
-        _, password, _ = run_command(
-            ["docker", "exec", "dev-vault", "sh", "-c",
-             f"export VAULT_TOKEN=$(cat /vault-keys/root-token) && vault kv get -field=password secret/{service}"],
-            capture=True,
-            check=False
-        )
-
-        password = password.strip()
+        password = (_vault_kv_get_json(service) or {}).get("password") or ""
 
-        if not password or password == "null":
+        if not password:
             console.print(f"[red]Error: Could not retrieve password for {service}[/red]")
             console.print("[yellow]Make sure the service exists in Vault: vault kv list secret/[/yellow]\n")
             sys.exit(1)
@@ -1624,13 +2541,7 @@ def forgejo_init():
         return
 
     # Check if Forgejo container is running
-    returncode, stdout, _ = run_command(
-        ["docker", "compose", "ps", "forgejo", "--format", "json"],
-        capture=True,
-        check=False
-    )
-
-    if returncode != 0 or "running" not in stdout.lower():
+    if not container_running("dev-forgejo"):
         console.print("[red]Error: Forgejo container is not running[/red]")
         console.print("[yellow]Start it with: docker compose up -d forgejo[/yellow]\n")
         return
@@ -1658,45 +2569,34 @@ def redis_cluster_init():
     Only needed once after first start with standard or full profile.
     """
     # Check if redis-1 is running
-    returncode, stdout, _ = run_command(
-        ["docker", "ps", "--filter", "name=dev-redis-1", "--format", "{{.Names}}"],
-        capture=True,
-        check=False
-    )
-
-    if returncode != 0 or "dev-redis-1" not in stdout:
+    if not container_running("dev-redis-1"):
         console.print("[red]Error: Redis containers are not running[/red]")
         console.print("[yellow]Start with: ./manage-devstack start --profile standard[/yellow]\n")
         return
 
     # Get Redis password from Vault
-    if not check_vault_token():
+    if not get_vault_token():
         console.print("[yellow]Warning: Vault token not found[/yellow]")
         console.print("[yellow]Cannot initialize cluster without Vault credentials[/yellow]\n")
         return
 
-    # Retrieve password from Vault (using token from inside container)
-    returncode, redis_password, _ = run_command(
-        ["docker", "exec", "dev-vault", "sh", "-c",
-         "export VAULT_TOKEN=$(cat /vault-keys/root-token) && vault kv get -field=password secret/redis-1"],
-        capture=True,
-        check=False
-    )
-
-    if returncode != 0:
+    redis_password = (_vault_kv_get_json("redis-1") or {}).get("password")
+    if not redis_password:
         console.print("[red]Error: Could not retrieve Redis password from Vault[/red]")
         console.print("[yellow]Ensure Vault is running and bootstrapped[/yellow]\n")
         return
 
-    redis_password = redis_password.strip()
-
-    # Call the bash script with the password
+    # Hand the password to the script on stdin rather than in its
+    # environment, which other processes of the same user can read. A
+    # REDIS_PASSWORD exported in the shell is blanked, since the script
+    # prefers it over stdin and the Vault password must win.
     script_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "configs", "redis", "scripts", "redis-cluster-init.sh")
     returncode, stdout, stderr = run_command(
         ["bash", script_path],
         capture=False,
         check=False,
-        env={"REDIS_PASSWORD": redis_password}
+        env={"REDIS_PASSWORD": ""},
+        input=redis_password + "\n"
     )
 
     if returncode != 0:
@@ -1705,6 +2605,78 @@ def redis_cluster_init():
         console.print()  # Extra newline for spacing
 
 
+@cli.command()
+def repl():
+    """
+    Run manage-devstack commands interactively in one long-lived process.
+
+    Each line is parsed like the command line (without the ./manage-devstack
+    prefix), so Python startup, imports, and the parsed profiles are paid
+    for once instead of per command.
+
+    \b
+    EXAMPLES:
+      ./manage-devstack repl
+      devstack> status
+      devstack> logs -n 20 postgres
+      devstack> health --watch
+      devstack> exit
+
+    \b
+    NOTES:
+      - 'help' lists commands; 'COMMAND --help' works as usual
+      - Ctrl+C interrupts the running command, Ctrl+D or 'exit' leaves
+    """
+    try:
+        # Imported for its side effect: input() gains line editing and history
+        importlib.import_module("readline")
+    except ImportError:
+        pass
+
+    console.print("[cyan]DevStack Core REPL[/cyan] [dim](type 'help' for commands, 'exit' to quit)[/dim]")
+
+    while True:
+        try:
+            line = input("devstack> ")
+        except EOFError:
+            console.print()
+            break
+        except KeyboardInterrupt:
+            console.print()
+            continue
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            continue
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+        if args[0] == "help":
+            args = ["--help"]
+        elif args[0] == "repl":
+            continue
+
+        # Colima may have been started or stopped, and Vault initialized or
+        # its credentials rewritten, from elsewhere since the last command
+        check_colima_status.cache_clear()
+        get_vault_token.cache_clear()
+        _vault_api_get.cache_clear()
+        try:
+            cli.main(args, prog_name="manage-devstack", standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+        except click.exceptions.Abort:
+            console.print("[yellow]Aborted[/yellow]")
+        except KeyboardInterrupt:
+            console.print()
+        except SystemExit:
+            # Commands exit on fatal errors; that ends the command, not the REPL
+            pass
+
+
 # ==============================================================================
 # Main Entry Point
 # ==============================================================================